@@ -16,21 +16,20 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
 import dataclasses
 import datetime as dt
-import fcntl
-import hashlib
+import functools
 import json
 import logging
+import mmap
 import os
-import re
 import shutil
-import stat
 import sys
-import tempfile
-from difflib import SequenceMatcher
+import types
+from collections import Counter, deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, IO
+from typing import Any, Callable, Coroutine, Deque, Dict, IO, List, Mapping, Optional, Set, Tuple, Union, TYPE_CHECKING
 
 import yaml  # Required for constraint loading
 
@@ -44,24 +43,27 @@ logger = logging.getLogger("arena")
 
 # Import utilities from utils module
 from utils import (
-    write_live, set_live_log, get_live_log,
-    utc_now_iso, read_text, ensure_secure_dir,
-    write_text_atomic, append_jsonl_durable,
-    load_json, save_json_atomic,
-    normalize_for_hash, sha256, text_similarity,
+    write_live, write_live_lines, set_live_log, get_live_log,
+    utc_now_iso, read_text, read_last_lines, ensure_secure_dir,
+    write_text_atomic, write_bytes_atomic, write_text_fast, write_bytes_fast,
+    copy_file_contents, replace_symlink,
+    JsonlBatcher, StateJournal,
+    load_json, save_json_atomic, json_loads, json_dumps_pretty,
+    thread_event_header,
+    texts_similar, count_words,
     validate_name, is_subpath, resolve_path_template,
-    VALID_NAME_PATTERN,
+    load_yaml, yaml_root_is_mapping, VALID_NAME_PATTERN,
 )
 
 # Import source resolution
 from sources import (
     SourceBlock, ResolvedSources,
-    resolve_source_block, resolve_legacy_sources,
+    resolve_source_block, resolve_source_block_cached, resolve_legacy_sources,
 )
 
 # Import data models
 from models import (
-    OrchestratorLock, Agent, Envelope,
+    OrchestratorLock, Agent, Envelope, ThreadEntry,
     ConstraintRule, Constraint,
     CritiqueIssue, Critique,
     AdjudicationDecision, Adjudication,
@@ -80,14 +82,10 @@ from config import (
     load_frontmatter_doc, load_mode, load_persona, load_profile, merge_profile,
 )
 
-# Import genloop config (for constraint-driven generation)
-from genloop_config import (
-    GenloopConfig, load_genloop_config, get_agents_for_constraint,
-)
-
-# Import genflow config and orchestrator (for configurable workflow engine)
-from genflow_config import GenflowConfig, load_genflow_config
-from genflow import run_genflow_orchestrator
+# Genloop/genflow modules (and the router) are imported where they are used,
+# so plain sequential/parallel runs don't pay for loading them
+if TYPE_CHECKING:
+    from genloop_config import GenloopConfig
 
 # Import HITL functions
 from hitl import (
@@ -100,36 +98,38 @@ EXIT_HITL = 10
 EXIT_MAX_TURNS = 11  # Changed from 1 to be distinct from generic failure
 EXIT_ERROR = 1
 
+# goal.yaml files at least this large are parsed from an mmap instead of a bytes copy
+GOAL_MMAP_THRESHOLD = 1024 * 1024
+
+# Bytes requested per read when capturing agent subprocess output
+STREAM_READ_SIZE = 64 * 1024
+
+# stderr kept in memory when it is also being written to a file
+STDERR_HEAD_BYTES = 4096
+
 # Context window settings for thread history
 DEFAULT_THREAD_HISTORY_COUNT = 10  # Number of recent messages to include
 DEFAULT_MESSAGE_TRUNCATE_LENGTH = 2000  # Characters per message (was 500)
+CRITIC_GOAL_MAX_LENGTH = 500  # Characters of the goal shown to critics
+CRITIQUE_SUMMARY_LINE = "  {agent} ({cid}): {crit} CRITICAL, {high} HIGH, {other} other"
+CRITIQUE_PASS_LINE = "  {agent} ({cid}): PASS"
+LARGE_CONTEXT_WORDS = 100000  # Warn above this adjudicator prompt size (rough proxy for tokens)
 
 # Script location for plugin-relative paths
 # When installed as plugin: points to plugin's scripts/ dir
 # When run standalone: points to ~/.arena/
-SCRIPT_DIR = Path(__file__).parent.resolve()
+_script_dir = os.path.realpath(os.path.dirname(os.path.abspath(__file__)))
+_config_dir = os.path.join(os.path.dirname(_script_dir), "config")
+SCRIPT_DIR = Path(_script_dir)
 # Default config dir is sibling to scripts/ in plugin structure, or same dir for standalone
-DEFAULT_CONFIG_DIR = (SCRIPT_DIR.parent / "config") if (SCRIPT_DIR.parent / "config").exists() else SCRIPT_DIR
-
-# Add script directory to path for relative imports (enables running from any directory)
-if str(SCRIPT_DIR) not in sys.path:
-    sys.path.insert(0, str(SCRIPT_DIR))
-
-# Import router for dynamic expert selection
-ROUTER_AVAILABLE = False
-ROUTER_IMPORT_ERROR: Optional[str] = None
-try:
-    from router import select_experts, load_experts, save_routing_result
-    ROUTER_AVAILABLE = True
-except ImportError as e:
-    ROUTER_IMPORT_ERROR = str(e)
+DEFAULT_CONFIG_DIR = Path(_config_dir) if os.path.isdir(_config_dir) else SCRIPT_DIR
 
 
 # =============================================================================
 # Goal Loading (YAML with source block support)
 # =============================================================================
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class LoadedGoal:
     """Result of loading a goal file."""
     goal_text: str
@@ -137,6 +137,46 @@ class LoadedGoal:
     source_block: Optional[SourceBlock] = None
 
 
+def _parse_goal_yaml(yaml_path: Path, size: int) -> Tuple[Any, Optional[bytes]]:
+    """Parse goal.yaml, returning (document, raw bytes if the root is not a mapping).
+
+    The root node is checked from the parser's event stream first, so plain-text
+    goals are never built into Python objects. Large files are handed to the
+    parser as a read-only mmap so the whole file is never copied into a Python
+    bytes object.
+    """
+    if size < GOAL_MMAP_THRESHOLD:
+        raw = yaml_path.read_bytes()
+        if not yaml_root_is_mapping(raw):
+            return None, raw
+        return load_yaml(raw), None
+
+    with yaml_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        if not yaml_root_is_mapping(mm):
+            return None, mm[:]
+        mm.seek(0)
+        return load_yaml(mm), None
+
+
+@functools.lru_cache(maxsize=32)
+def _goal_source_ctx(
+    project_root: Path,
+    run_dir: Path,
+    arena_home: Optional[Path],
+) -> Mapping[str, Path]:
+    """Path variables for a goal's source block (shared, so read-only)."""
+    ctx = {
+        "project_root": project_root,
+        "run_dir": run_dir,
+        "constraint_dir": run_dir,  # For goal, constraint_dir = run_dir
+    }
+    if arena_home:
+        ctx["arena_home"] = arena_home
+    return types.MappingProxyType(ctx)
+
+
 def load_goal(
     run_dir: Path,
     project_root: Path,
@@ -164,20 +204,43 @@ def load_goal(
     yaml_path = run_dir / "goal.yaml"
     md_path = run_dir / "goal.md"
 
-    # Try goal.yaml first
-    if yaml_path.exists():
+    # Try goal.yaml first (the stat doubles as the existence check)
+    try:
+        st = yaml_path.stat()
+    except FileNotFoundError:
+        st = None
+
+    if st is not None:
         try:
-            content = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
-            if not isinstance(content, dict):
-                logger.warning(f"goal.yaml is not a valid YAML dict, treating as plain text")
-                return LoadedGoal(
-                    goal_text=yaml_path.read_text(encoding="utf-8"),
-                    source_content="",
-                )
+            # Reuse the parsed document from the previous load if goal.yaml is unchanged
+            cache_path = run_dir / ".cache" / "goal.json"
+            cache_key = [st.st_mtime_ns, st.st_size]
+            cached = load_json(cache_path, None)
+            if isinstance(cached, dict) and cached.get("key") == cache_key:
+                content = cached.get("content", {})
+            else:
+                parsed, raw = _parse_goal_yaml(yaml_path, st.st_size)
+                if raw is not None:
+                    logger.warning("goal.yaml is not a valid YAML dict, treating as plain text")
+                    return LoadedGoal(
+                        goal_text=raw.decode("utf-8"),
+                        source_content="",
+                    )
+                # Cache the goal pre-stripped (a block scalar keeps its trailing
+                # newline), so the strip below is a no-op on every later load
+                goal = parsed.get("goal")
+                content = {
+                    "goal": goal.strip() if isinstance(goal, str) else goal,
+                    "source": parsed.get("source"),
+                }
+                try:
+                    save_json_atomic(cache_path, {"key": cache_key, "content": content})
+                except (TypeError, ValueError, OSError) as e:
+                    logger.debug("Not caching goal.yaml: %s", e)
 
             goal_text = content.get("goal", "")
             if not goal_text:
-                logger.error(f"goal.yaml missing 'goal' field")
+                logger.error("goal.yaml missing 'goal' field")
                 return None
 
             # Resolve source block if present
@@ -185,21 +248,15 @@ def load_goal(
             source_block = None
             if "source" in content and content["source"]:
                 source_block = SourceBlock.from_dict(content["source"])
-                ctx = {
-                    "project_root": project_root,
-                    "run_dir": run_dir,
-                    "constraint_dir": run_dir,  # For goal, constraint_dir = run_dir
-                }
-                if arena_home:
-                    ctx["arena_home"] = arena_home
-
+                ctx = _goal_source_ctx(project_root, run_dir, arena_home)
                 resolved = resolve_source_block(
                     source_block, ctx, run_dir, allow_scripts=allow_scripts
                 )
                 source_content = resolved.content
                 if resolved.warnings:
-                    for warn in resolved.warnings:
-                        logger.warning(f"Goal source: {warn}")
+                    logger.warning(
+                        "Goal source warnings:\n  - %s", "\n  - ".join(resolved.warnings)
+                    )
 
             return LoadedGoal(
                 goal_text=goal_text.strip(),
@@ -207,27 +264,24 @@ def load_goal(
                 source_block=source_block,
             )
         except yaml.YAMLError as e:
-            logger.error(f"Failed to parse goal.yaml: {e}")
+            logger.error("Failed to parse goal.yaml: %s", e)
             return None
 
     # Fall back to goal.md (legacy)
-    if md_path.exists():
-        goal_text = read_text(md_path)
-        # Also check for separate source.md (legacy)
-        source_path = run_dir / "source.md"
-        source_content = read_text(source_path) if source_path.exists() else ""
-        return LoadedGoal(
-            goal_text=goal_text.strip(),
-            source_content=source_content,
-        )
-
-    return None
+    try:
+        goal_text = md_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    # Also check for separate source.md (legacy)
+    source_content = read_text(run_dir / "source.md")
+    return LoadedGoal(
+        goal_text=goal_text.strip(),
+        source_content=source_content,
+    )
 
 
-def create_goal_template(run_dir: Path) -> Path:
-    """Create a template goal.yaml for user to edit."""
-    goal_path = run_dir / "goal.yaml"
-    template = """# Goal definition for Arena orchestration
+# Template written for new runs (pre-encoded so it goes to disk as-is)
+GOAL_TEMPLATE = b"""# Goal definition for Arena orchestration
 # See /arena:genloop --help for full documentation
 
 goal: |
@@ -246,7 +300,22 @@ goal: |
 #   inline: |
 #     Additional context here.
 """
-    goal_path.write_text(template, encoding="utf-8")
+
+
+def create_goal_template(run_dir: Path) -> Optional[Path]:
+    """Create a template goal.yaml for user to edit.
+
+    Returns None (leaving the file untouched) if goal.yaml already exists.
+    """
+    goal_path = run_dir / "goal.yaml"
+    try:
+        fd = os.open(goal_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return None
+    try:
+        os.write(fd, GOAL_TEMPLATE)
+    finally:
+        os.close(fd)
     return goal_path
 
 
@@ -254,45 +323,18 @@ goal: |
 # Prompt Templates for Reliable Generation
 # =============================================================================
 
-def build_generator_prompt(
-    goal: str,
-    source: str,
-    compressed_constraints: str,
-    previous_artifact: Optional[str],
-    previous_adjudication: Optional[Adjudication],
-    iteration: int,
-) -> str:
-    """Build prompt for the generator phase."""
-    refinement_section = ""
-    if previous_artifact and previous_adjudication:
-        refinement_section = f"""
-PREVIOUS ARTIFACT (ITERATION {iteration - 1})
-{previous_artifact}
-
-ADJUDICATION FEEDBACK
-{previous_adjudication.bill_of_work}
-
-INSTRUCTIONS
-You are REFINING the previous artifact. Apply ONLY the fixes specified in the bill of work.
-Do NOT introduce new content or restructure unless specifically required by the feedback.
-Maintain the original structure and intent while addressing the issues.
-"""
-    else:
-        refinement_section = """
-INSTRUCTIONS
-Generate initial content that satisfies the goal while adhering to all constraints.
-Be thorough and complete - this is your first draft.
-"""
+# Prompt skeletons are module-level str.format templates: only the
+# substitutions happen per call. Literal braces are doubled.
 
-    return f"""\
+GENERATOR_PROMPT = """\
 SYSTEM CONTEXT
 You are a generator agent in a reliable generation pipeline.
 Iteration: {iteration}
 
 GOAL
-{goal.strip()}
+{goal}
 
-{f"SOURCE MATERIAL{chr(10)}{source.strip()}" if source else ""}
+{source_section}
 
 CONSTRAINTS
 {compressed_constraints}
@@ -301,35 +343,68 @@ CONSTRAINTS
 
 OUTPUT
 Produce ONLY the artifact content (no JSON envelope, no explanations).
-The output should be the complete, final text ready for critique.
-""".strip()
+The output should be the complete, final text ready for critique."""
 
+GENERATOR_REFINE_SECTION = """
+PREVIOUS ARTIFACT (ITERATION {previous_iteration})
+{previous_artifact}
 
-def build_refinement_prompt(
-    artifact_path: Path,
-    adjudication: Adjudication,
+ADJUDICATION FEEDBACK
+{bill_of_work}
+
+INSTRUCTIONS
+You are REFINING the previous artifact. Apply ONLY the fixes specified in the bill of work.
+Do NOT introduce new content or restructure unless specifically required by the feedback.
+Maintain the original structure and intent while addressing the issues.
+"""
+
+GENERATOR_INITIAL_SECTION = """
+INSTRUCTIONS
+Generate initial content that satisfies the goal while adhering to all constraints.
+Be thorough and complete - this is your first draft.
+"""
+
+
+def build_generator_prompt(
     goal: str,
+    source: str,
+    compressed_constraints: str,
+    previous_artifact: Optional[str],
+    previous_adjudication: Optional[Adjudication],
     iteration: int,
 ) -> str:
-    """Build prompt for refinement phase using file-based editing.
+    """Build prompt for the generator phase."""
+    if previous_artifact and previous_adjudication:
+        refinement_section = GENERATOR_REFINE_SECTION.format(
+            previous_iteration=iteration - 1,
+            previous_artifact=previous_artifact,
+            bill_of_work=previous_adjudication.bill_of_work,
+        )
+    else:
+        refinement_section = GENERATOR_INITIAL_SECTION
+
+    return GENERATOR_PROMPT.format(
+        iteration=iteration,
+        goal=goal.strip(),
+        source_section=f"SOURCE MATERIAL\n{source.strip()}" if source else "",
+        compressed_constraints=compressed_constraints,
+        refinement_section=refinement_section,
+    )
 
-    Instead of embedding the full artifact in the prompt and asking for
-    regeneration, this prompt instructs the generator to use the Edit tool
-    to make surgical modifications to the artifact file.
-    """
-    return f"""\
+
+REFINEMENT_PROMPT = """\
 REFINEMENT TASK
 You are refining an artifact based on adjudicator feedback.
 Iteration: {iteration}
 
 GOAL (for context)
-{goal.strip()}
+{goal}
 
 ARTIFACT LOCATION
 The artifact to edit is at: {artifact_path}
 
 BILL OF WORK
-{adjudication.bill_of_work}
+{bill_of_work}
 
 INSTRUCTIONS
 1. Read the artifact file using the Read tool
@@ -345,8 +420,60 @@ CRITICAL RULES
 - Use the Edit tool to modify the file - do NOT output the full artifact text
 - Make one edit at a time for each issue in the bill of work
 - Preserve surrounding content exactly as-is
-- Do not "improve" or "clean up" content not mentioned in the bill of work
-""".strip()
+- Do not "improve" or "clean up" content not mentioned in the bill of work"""
+
+
+def build_refinement_prompt(
+    artifact_path: Path,
+    adjudication: Adjudication,
+    goal: str,
+    iteration: int,
+) -> str:
+    """Build prompt for refinement phase using file-based editing.
+
+    Instead of embedding the full artifact in the prompt and asking for
+    regeneration, this prompt instructs the generator to use the Edit tool
+    to make surgical modifications to the artifact file.
+    """
+    return REFINEMENT_PROMPT.format(
+        iteration=iteration,
+        goal=goal.strip(),
+        artifact_path=artifact_path,
+        bill_of_work=adjudication.bill_of_work,
+    )
+
+
+# Artifact word counts keyed by path, valid while (mtime_ns, size) match. An
+# iteration's artifact is the next iteration's "previous" one, so each file is
+# counted once. Only recent artifacts are ever looked up again, so the cache is
+# emptied when it reaches ARTIFACT_WORD_COUNTS_MAX entries.
+ARTIFACT_WORD_COUNTS_MAX = 8
+_artifact_word_counts: Dict[Path, Tuple[int, int, int]] = {}
+
+
+def artifact_word_count(path: Path, st: os.stat_result, data: Optional[bytes] = None) -> int:
+    """Word count of an artifact file, cached by path and (mtime_ns, size)."""
+    cached = _artifact_word_counts.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    words = count_words(path.read_bytes() if data is None else data)
+    if len(_artifact_word_counts) >= ARTIFACT_WORD_COUNTS_MAX:
+        _artifact_word_counts.clear()
+    _artifact_word_counts[path] = (st.st_mtime_ns, st.st_size, words)
+    return words
+
+
+def load_thrash_counts(state: Dict[str, Any]) -> Tuple[List[int], Dict[str, int]]:
+    """Per-issue thrash counts from genloop state, as (counts, issue_id_map).
+
+    Counts are a dense list indexed through issue_id_map. State from older
+    runs keeps them as an {issue_id: count} dict and is converted here; the
+    caller journals both keys together, which replaces the old form.
+    """
+    counts = state.get("issue_thrash_counts", [])
+    if isinstance(counts, dict):
+        return list(counts.values()), {issue_id: idx for idx, issue_id in enumerate(counts)}
+    return list(counts), dict(state.get("issue_id_map", {}))
 
 
 def validate_artifact_changed(
@@ -359,18 +486,24 @@ def validate_artifact_changed(
     Returns:
         Tuple of (changed: bool, reason: str)
     """
-    if not prev_artifact_path.exists():
+    try:
+        prev_st = prev_artifact_path.stat()
+    except FileNotFoundError:
         return True, "No previous artifact to compare"
+    curr_st = curr_artifact_path.stat()
 
-    prev_content = prev_artifact_path.read_text(encoding="utf-8")
-    curr_content = curr_artifact_path.read_text(encoding="utf-8")
-
-    if prev_content == curr_content:
-        return False, "Artifact unchanged - generator made no edits"
+    # Files of different sizes can't be equal, so they're only read (as bytes:
+    # a length check plus memcmp, nothing decoded) when the sizes match
+    prev_content = curr_content = None
+    if prev_st.st_size == curr_st.st_size:
+        prev_content = prev_artifact_path.read_bytes()
+        curr_content = curr_artifact_path.read_bytes()
+        if prev_content == curr_content:
+            return False, "Artifact unchanged - generator made no edits"
 
     # Check if word count changed significantly (indicates regeneration vs editing)
-    prev_words = len(prev_content.split())
-    curr_words = len(curr_content.split())
+    prev_words = artifact_word_count(prev_artifact_path, prev_st, prev_content)
+    curr_words = artifact_word_count(curr_artifact_path, curr_st, curr_content)
 
     if prev_words > 0:
         pct_change = abs(curr_words - prev_words) / prev_words * 100
@@ -380,6 +513,142 @@ def validate_artifact_changed(
     return True, "Artifact modified"
 
 
+CRITIC_PROMPT = """\
+SYSTEM CONTEXT
+You are a critic agent reviewing content for constraint: {constraint_id}
+Iteration: {iteration}
+
+CONSTRAINT: {constraint_label}
+Priority: {priority}
+
+{summary}
+{sources_section}{script_section}RULES TO EVALUATE
+{rules}
+
+GOAL CONTEXT
+{goal}
+
+ARTIFACT TO REVIEW
+{artifact}
+
+OUTPUT REQUIREMENTS
+Respond with a SINGLE JSON object (no markdown, no extra text):
+{{
+  "constraint_id": "{constraint_id}",
+  "overall": "PASS" | "FAIL",
+  "issues": [
+    {{
+      "id": "{constraint_id}-001",
+      "rule_id": "rule-id-that-was-violated",
+      "severity": "CRITICAL" | "HIGH" | "MEDIUM" | "LOW",
+      "location": "paragraph X, sentence Y" or "section name",
+      "finding": "What is wrong",
+      "evidence": "Quote or reference from rules",
+      "suggested_fix": "How to fix it",
+      "confidence": 0.0-1.0
+    }}
+  ],
+  "approved_sections": [
+    {{"location": "paragraphs 1-5", "note": "Meets all criteria"}}
+  ],
+  "summary": "Brief summary of findings"
+}}
+
+EVALUATION GUIDELINES
+- Be thorough but fair - only flag genuine violations
+- Provide specific locations for each issue
+- Suggest concrete fixes, not vague improvements
+- Rate confidence based on clarity of violation
+- If no issues found, return overall: "PASS" with empty issues array"""
+
+CRITIC_SCRIPT_SECTION = """
+PRE-ANALYSIS SCRIPT
+Before your analysis, run this script to get additional validation information:
+```
+{script} < {artifact_path}
+```
+
+Execute the script and interpret the results as part of your critique.
+Include any script output, errors, or issues in your findings.
+If the script reports validation errors, treat them as findings in your response.
+
+"""
+
+CRITIC_SOURCES_SECTION = """
+SOURCE MATERIAL
+The following source material is provided for fact-checking and context:
+
+{content}
+
+"""
+
+CRITIC_REFERENCES_SECTION = """
+REFERENCE SOURCES
+Read these files for context before your analysis:
+{sources_list}
+
+"""
+
+
+# Rendered RULES TO EVALUATE blocks, keyed by constraint. Constraints are
+# loaded once per run and never mutated, so every iteration's critics reuse them.
+_rendered_rules: Dict[Tuple[str, Optional[Path]], str] = {}
+
+
+def render_constraint_rules(constraint: Constraint) -> str:
+    """Render a constraint's rules (with examples) for the critic prompt."""
+    key = (constraint.id, constraint.source_path)
+    rendered = _rendered_rules.get(key)
+    if rendered is None:
+        # One flat list of lines, joined once (no per-rule string concatenation)
+        rule_lines: List[str] = []
+        for rule in constraint.rules:
+            rule_lines += (
+                f"### Rule: {rule.id}",
+                str(rule.text),
+                f"Default Severity: {rule.default_severity}",
+            )
+            if rule.examples:
+                if "violation" in rule.examples:
+                    rule_lines.append(f"Example Violation: {rule.examples['violation']}")
+                if "compliant" in rule.examples:
+                    rule_lines.append(f"Example Compliant: {rule.examples['compliant']}")
+        rendered = _rendered_rules[key] = "\n".join(rule_lines)
+    return rendered
+
+
+# Resolved constraint script paths. The inputs are per-run constants (apart
+# from {{artifact}}, which only counts when the template uses it), so each
+# script is resolved once instead of for every critic in every iteration.
+# Scripts using {{artifact}} add a key per iteration, so the cache is emptied
+# when it reaches RESOLVED_SCRIPTS_MAX entries.
+RESOLVED_SCRIPTS_MAX = 64
+_resolved_scripts: Dict[Tuple[str, Tuple[Tuple[str, str], ...], Path], Path] = {}
+
+
+def resolve_constraint_script(script: str, ctx: Dict[str, Path], base_dir: Path) -> Path:
+    """resolve_path_template for a constraint script, memoized.
+
+    Raises:
+        ValueError: If the resolved path escapes allowed directories (not cached)
+    """
+    key = (
+        script,
+        tuple(sorted(
+            (var, str(value)) for var, value in ctx.items()
+            if var != "artifact" or "{{artifact}}" in script
+        )),
+        base_dir,
+    )
+    resolved = _resolved_scripts.get(key)
+    if resolved is None:
+        resolved = resolve_path_template(script, ctx, base_dir)
+        if len(_resolved_scripts) >= RESOLVED_SCRIPTS_MAX:
+            _resolved_scripts.clear()
+        _resolved_scripts[key] = resolved
+    return resolved
+
+
 def build_critic_prompt(
     constraint: Constraint,
     artifact: str,
@@ -404,15 +673,6 @@ def build_critic_prompt(
         allow_scripts: Whether to allow script execution in source blocks
         arena_home: Global arena home directory (~/.arena/)
     """
-    rules_section = []
-    for rule in constraint.rules:
-        rule_text = f"### Rule: {rule.id}\n{rule.text}\nDefault Severity: {rule.default_severity}"
-        if rule.examples:
-            if "violation" in rule.examples:
-                rule_text += f"\nExample Violation: {rule.examples['violation']}"
-            if "compliant" in rule.examples:
-                rule_text += f"\nExample Compliant: {rule.examples['compliant']}"
-        rules_section.append(rule_text)
 
     # Build context for path resolution
     ctx = {}
@@ -437,28 +697,20 @@ def build_critic_prompt(
     script_section = ""
     if constraint.script and run_dir and project_root and artifact_path:
         try:
-            resolved_script = resolve_path_template(constraint.script, ctx, base_dir)
-            script_section = f"""
-PRE-ANALYSIS SCRIPT
-Before your analysis, run this script to get additional validation information:
-```
-{resolved_script} < {artifact_path}
-```
-
-Execute the script and interpret the results as part of your critique.
-Include any script output, errors, or issues in your findings.
-If the script reports validation errors, treat them as findings in your response.
-
-"""
+            resolved_script = resolve_constraint_script(constraint.script, ctx, base_dir)
+            script_section = CRITIC_SCRIPT_SECTION.format(
+                script=resolved_script, artifact_path=artifact_path
+            )
         except ValueError as e:
-            logger.warning(f"Invalid script path in constraint {constraint.id}: {e}")
+            logger.warning("Invalid script path in constraint %s: %s", constraint.id, e)
 
     # Build sources section - NEW format (source_block) vs OLD format (sources)
     sources_section = ""
 
     if constraint.source_block and run_dir and project_root:
-        # NEW format: resolve source block and inject content
-        resolved = resolve_source_block(
+        # NEW format: resolve source block and inject content (reused across
+        # iterations while the files it read are unchanged)
+        resolved = resolve_source_block_cached(
             source_block=constraint.source_block,
             ctx=ctx,
             base_dir=base_dir,
@@ -467,119 +719,48 @@ If the script reports validation errors, treat them as findings in your response
 
         if resolved.errors:
             for error in resolved.errors:
-                logger.warning(f"Source resolution error in {constraint.id}: {error}")
+                logger.warning("Source resolution error in %s: %s", constraint.id, error)
 
         if resolved.warnings:
             for warning in resolved.warnings:
-                logger.info(f"Source resolution warning in {constraint.id}: {warning}")
+                logger.info("Source resolution warning in %s: %s", constraint.id, warning)
 
         if resolved.content.strip():
-            sources_section = f"""
-SOURCE MATERIAL
-The following source material is provided for fact-checking and context:
-
-{resolved.content}
-
-"""
+            sources_section = CRITIC_SOURCES_SECTION.format(content=resolved.content)
 
     elif constraint.sources and run_dir and project_root:
         # OLD format: just list paths (backward compatibility)
         resolved_sources, errors = resolve_legacy_sources(constraint.sources, ctx, base_dir)
 
         for error in errors:
-            logger.warning(f"Legacy source error in {constraint.id}: {error}")
+            logger.warning("Legacy source error in %s: %s", constraint.id, error)
 
         if resolved_sources:
-            sources_list = "\n".join(f"- {p}" for p in resolved_sources)
-            sources_section = f"""
-REFERENCE SOURCES
-Read these files for context before your analysis:
-{sources_list}
-
-"""
-
-    return f"""\
-SYSTEM CONTEXT
-You are a critic agent reviewing content for constraint: {constraint.id}
-Iteration: {iteration}
-
-CONSTRAINT: {constraint.id.upper()}
-Priority: {constraint.priority}
-
-{constraint.summary}
-{sources_section}{script_section}RULES TO EVALUATE
-{chr(10).join(rules_section)}
-
-GOAL CONTEXT
-{goal[:500]}
-
-ARTIFACT TO REVIEW
-{artifact}
-
-OUTPUT REQUIREMENTS
-Respond with a SINGLE JSON object (no markdown, no extra text):
-{{
-  "constraint_id": "{constraint.id}",
-  "overall": "PASS" | "FAIL",
-  "issues": [
-    {{
-      "id": "{constraint.id}-001",
-      "rule_id": "rule-id-that-was-violated",
-      "severity": "CRITICAL" | "HIGH" | "MEDIUM" | "LOW",
-      "location": "paragraph X, sentence Y" or "section name",
-      "finding": "What is wrong",
-      "evidence": "Quote or reference from rules",
-      "suggested_fix": "How to fix it",
-      "confidence": 0.0-1.0
-    }}
-  ],
-  "approved_sections": [
-    {{"location": "paragraphs 1-5", "note": "Meets all criteria"}}
-  ],
-  "summary": "Brief summary of findings"
-}}
-
-EVALUATION GUIDELINES
-- Be thorough but fair - only flag genuine violations
-- Provide specific locations for each issue
-- Suggest concrete fixes, not vague improvements
-- Rate confidence based on clarity of violation
-- If no issues found, return overall: "PASS" with empty issues array
-""".strip()
-
-
-def build_adjudicator_prompt(
-    constraints: List[Constraint],
-    artifact: str,
-    critiques: List[Critique],
-    goal: str,
-    iteration: int,
-    max_iterations: int,
-) -> str:
-    """Build prompt for the adjudicator phase."""
-    constraints_section = "\n".join(
-        f"- {c.id} (priority {c.priority}): {c.summary[:100]}..."
-        for c in constraints
+            sources_list = "\n".join([f"- {p}" for p in resolved_sources])
+            sources_section = CRITIC_REFERENCES_SECTION.format(sources_list=sources_list)
+
+    return CRITIC_PROMPT.format(
+        constraint_id=constraint.id,
+        constraint_label=constraint.id.upper(),
+        iteration=iteration,
+        priority=constraint.priority,
+        summary=constraint.summary,
+        sources_section=sources_section,
+        script_section=script_section,
+        rules=render_constraint_rules(constraint),
+        goal=goal[:CRITIC_GOAL_MAX_LENGTH],
+        artifact=artifact,
     )
 
-    critiques_section = []
-    for critique in critiques:
-        critique_text = f"### {critique.reviewer} on {critique.constraint_id}: {critique.overall}"
-        if critique.issues:
-            for issue in critique.issues:
-                critique_text += f"\n  - [{issue.severity}] {issue.id}: {issue.finding}"
-        else:
-            critique_text += "\n  No issues found"
-        critiques_section.append(critique_text)
 
-    return f"""\
+ADJUDICATOR_PROMPT = """\
 SYSTEM CONTEXT
 You are the adjudicator in a reliable generation pipeline.
 Your role is to find the optimal boundary between competing constraints.
 Iteration: {iteration}/{max_iterations}
 
 GOAL
-{goal.strip()}
+{goal}
 
 CONSTRAINTS (ordered by priority)
 {constraints_section}
@@ -588,7 +769,7 @@ ARTIFACT UNDER REVIEW
 {artifact}
 
 CRITIQUES FROM ALL REVIEWERS
-{chr(10).join(critiques_section)}
+{critiques}
 
 YOUR ROLE
 1. Analyze tensions between competing constraints
@@ -678,25 +859,82 @@ APPROVAL CRITERIA
 - Status should be "APPROVED" only if:
   - No CRITICAL issues pursuing
   - No HIGH issues pursuing (or profile allows some HIGH issues)
-- Otherwise status should be "REWRITE"
-""".strip()
+- Otherwise status should be "REWRITE\""""
+
+
+def build_adjudicator_prompt(
+    constraints: List[Constraint],
+    artifact: str,
+    critiques: List[Critique],
+    goal: str,
+    iteration: int,
+    max_iterations: int,
+) -> str:
+    """Build prompt for the adjudicator phase."""
+    constraints_section = "\n".join([
+        f"- {c.id} (priority {c.priority}): {c.summary_preview}..."
+        for c in constraints
+    ])
+
+    # One flat list of lines, joined once (no per-critique string concatenation)
+    critique_lines: List[str] = []
+    for critique in critiques:
+        critique_lines.append(
+            f"### {critique.reviewer} on {critique.constraint_id}: {critique.overall}"
+        )
+        if critique.issues:
+            critique_lines += [
+                f"  - [{issue.severity}] {issue.id}: {issue.finding}"
+                for issue in critique.issues
+            ]
+        else:
+            critique_lines.append("  No issues found")
+
+    return ADJUDICATOR_PROMPT.format(
+        iteration=iteration,
+        max_iterations=max_iterations,
+        goal=goal.strip(),
+        constraints_section=constraints_section,
+        artifact=artifact,
+        critiques="\n".join(critique_lines),
+    )
+
+
+def resolve_agent_cmd(cmd: List[str]) -> List[str]:
+    """Resolve an agent command's executable against PATH once, at startup.
+
+    Each spawn then execs the absolute path directly instead of trying every
+    PATH entry. Commands whose executable isn't found are returned unchanged,
+    so the error still surfaces when the agent is run.
+    """
+    if not cmd or os.sep in cmd[0]:
+        return cmd
+    exe = shutil.which(cmd[0])
+    return [exe, *cmd[1:]] if exe else cmd
 
 
 async def run_process(
     cmd: List[str],
-    stdin_text: str,
+    stdin_data: Union[str, bytes],
     timeout: Optional[int],
     stream_prefix: Optional[str] = None,
     suppress_stderr: bool = False,
+    output_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
 ) -> Tuple[int, str, str]:
     """Run subprocess with optional timeout and streaming output.
 
     Args:
         cmd: Command to run
-        stdin_text: Text to send to stdin
+        stdin_data: Text (encoded as UTF-8) or bytes to send to stdin
         timeout: Timeout in seconds (None = no timeout)
         stream_prefix: If set, stream output to console with this prefix
         suppress_stderr: If True, don't stream stderr (still capture it)
+        output_path: If set, stdout is written to this file as it arrives
+            instead of being captured (the returned stdout is then empty)
+        stderr_path: If set, stderr is written to this file as it arrives
+            (created on the first non-blank output); only its first
+            STDERR_HEAD_BYTES are returned
 
     Returns:
         (returncode, stdout, stderr)
@@ -708,66 +946,144 @@ async def run_process(
         stderr=asyncio.subprocess.PIPE,
     )
 
-    # Write stdin and close
-    if proc.stdin:
-        proc.stdin.write(stdin_text.encode("utf-8"))
-        await proc.stdin.drain()
-        proc.stdin.close()
-        await proc.stdin.wait_closed()
+    stdin_bytes = stdin_data.encode("utf-8") if isinstance(stdin_data, str) else stdin_data
+
+    # Output is kept as raw bytes (one b"\n" per line) and decoded once at the end
+    stdout_buf = bytearray()
+    stderr_buf = bytearray()
 
-    stdout_lines: List[str] = []
-    stderr_lines: List[str] = []
+    def decode_output(buf: bytearray) -> str:
+        """Decode captured output, dropping the newline after the last line."""
+        if buf.endswith(b"\n"):
+            buf = buf[:-1]
+        return buf.decode("utf-8", errors="replace")
 
     async def read_stream(
-        stream: asyncio.StreamReader, lines: List[str], is_stderr: bool = False
+        stream: asyncio.StreamReader, write: Callable[[bytes], Any], is_stderr: bool = False
     ) -> None:
-        """Read stream line by line, optionally printing with prefix."""
-        while True:
-            line_bytes = await stream.readline()
-            if not line_bytes:
-                break
-            line = line_bytes.decode("utf-8", errors="replace").rstrip("\n\r")
-            lines.append(line)
-            # Skip streaming stderr if suppressed (still captured in lines)
-            if is_stderr and suppress_stderr:
-                continue
-            if stream_prefix:
-                prefix = f"{stream_prefix}"
-                if is_stderr:
-                    prefix = f"{stream_prefix} [stderr]"
+        """Read stream in bulk chunks, handing each line to write().
+
+        Lines are optionally printed with prefix. Chunked reads also avoid
+        readline()'s 64 KiB line limit (agents can emit one-line JSON).
+        """
+        # Skip streaming stderr if suppressed (still captured)
+        echo = bool(stream_prefix) and not (is_stderr and suppress_stderr)
+        prefix = f"{stream_prefix} [stderr]" if is_stderr else f"{stream_prefix}"
+
+        def handle_line(line_bytes: bytes) -> None:
+            line_bytes = line_bytes.rstrip(b"\r")
+            write(line_bytes)
+            write(b"\n")
+            if echo:
+                line = line_bytes.decode("utf-8", errors="replace")
                 # Write to live log
                 write_live(line, prefix=f"{prefix}: ")
                 # Also print to stdout
                 print(f"  {prefix}: {line}", flush=True)
 
-    async def run_with_streaming() -> int:
+        pending = bytearray()
+        while True:
+            chunk = await stream.read(STREAM_READ_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+            start = 0
+            while (nl := pending.find(b"\n", start)) != -1:
+                handle_line(bytes(pending[start:nl]))
+                start = nl + 1
+            del pending[:start]
+        if pending:
+            handle_line(bytes(pending))
+
+    async def feed_stdin() -> None:
+        """Write stdin in one go and close it, like communicate().
+
+        Runs alongside the readers, so a child that writes output before it
+        has read all of a large prompt can't deadlock on a full pipe.
+        """
+        if not proc.stdin:
+            return
+        try:
+            proc.stdin.write(stdin_bytes)
+            await proc.stdin.drain()
+            proc.stdin.close()
+            await proc.stdin.wait_closed()
+        except (BrokenPipeError, ConnectionResetError):
+            # The child exited without reading all of its input
+            pass
+
+    async def run_with_streaming(
+        write_stdout: Callable[[bytes], Any], write_stderr: Callable[[bytes], Any]
+    ) -> int:
         """Run the process with streaming output."""
         await asyncio.gather(
-            read_stream(proc.stdout, stdout_lines, is_stderr=False),
-            read_stream(proc.stderr, stderr_lines, is_stderr=True),
+            feed_stdin(),
+            read_stream(proc.stdout, write_stdout, is_stderr=False),
+            read_stream(proc.stderr, write_stderr, is_stderr=True),
         )
         await proc.wait()
         return proc.returncode or 0
 
-    try:
-        if timeout:
-            rc = await asyncio.wait_for(run_with_streaming(), timeout=timeout)
-        else:
-            rc = await run_with_streaming()
-        return rc, "\n".join(stdout_lines), "\n".join(stderr_lines)
-    except asyncio.TimeoutError:
-        # Graceful shutdown: try terminate first, then kill
+    with contextlib.ExitStack() as files:
+        write_stdout: Callable[[bytes], Any] = stdout_buf.extend
+        if output_path:
+            write_stdout = files.enter_context(open(output_path, "wb")).write
+
+        write_stderr: Callable[[bytes], Any] = stderr_buf.extend
+        if stderr_path:
+            stderr_file: Optional[IO[bytes]] = None
+            # Leading blank output is held back, so stderr that is only
+            # whitespace (a lone newline, say) doesn't leave a log file behind
+            stderr_blank = bytearray()
+
+            def write_stderr_file(data: bytes) -> None:
+                """Append to stderr_path, keeping the head of stderr in memory."""
+                nonlocal stderr_file
+                if len(stderr_buf) < STDERR_HEAD_BYTES:
+                    stderr_buf.extend(data)
+                if stderr_file is None:
+                    if not data or data.isspace():
+                        stderr_blank.extend(data)
+                        return
+                    try:
+                        stderr_file = open(stderr_path, "wb")
+                    except FileNotFoundError:
+                        stderr_path.parent.mkdir(parents=True, exist_ok=True)
+                        stderr_file = open(stderr_path, "wb")
+                    files.callback(stderr_file.close)
+                    stderr_file.write(stderr_blank)
+                stderr_file.write(data)
+
+            write_stderr = write_stderr_file
+
         try:
-            proc.terminate()
-            await asyncio.wait_for(proc.wait(), timeout=5)
+            if timeout:
+                rc = await asyncio.wait_for(
+                    run_with_streaming(write_stdout, write_stderr), timeout=timeout
+                )
+            else:
+                rc = await run_with_streaming(write_stdout, write_stderr)
+            return rc, decode_output(stdout_buf), decode_output(stderr_buf)
         except asyncio.TimeoutError:
-            proc.kill()
-            await proc.wait()
-        return -1, "\n".join(stdout_lines), f"Process timed out after {timeout}s"
+            # Graceful shutdown: try terminate first, then kill
+            try:
+                proc.terminate()
+                await asyncio.wait_for(proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+            return -1, decode_output(stdout_buf), f"Process timed out after {timeout}s"
+        except asyncio.CancelledError:
+            # Don't leave the agent running once its caller has given up on it
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+            raise
 
 
 async def run_agent(
-    agent: Agent, prompt: str, stream: bool = True
+    agent: Agent, prompt: str, stream: bool = True, stderr_path: Optional[Path] = None
 ) -> Tuple[Envelope, str, str]:
     """Run agent CLI and parse response.
 
@@ -775,10 +1091,13 @@ async def run_agent(
         agent: Agent to run
         prompt: Prompt to send
         stream: If True, stream output to console with agent name prefix
+        stderr_path: If set, the agent's stderr is written there as it
+            arrives (see run_process)
     """
     stream_prefix = agent.name if stream else None
     rc, stdout, stderr = await run_process(
-        agent.cmd, prompt, agent.timeout, stream_prefix, agent.suppress_stderr
+        agent.cmd, prompt, agent.timeout, stream_prefix, agent.suppress_stderr,
+        stderr_path=stderr_path,
     )
 
     if rc == -1:  # Timeout
@@ -789,7 +1108,7 @@ async def run_agent(
 
     # Warn if non-zero exit but has output
     if rc != 0:
-        logger.warning(f"Agent {agent.name} exited with code {rc} but produced output")
+        logger.warning("Agent %s exited with code %s but produced output", agent.name, rc)
 
     env, err = parse_envelope(stdout, agent.kind)
     return env, stdout, stderr
@@ -840,54 +1159,33 @@ Be thorough but concise. No fluff.
     return stdout.strip()
 
 
-def build_prompt(
-    agent_name: str,
-    mode: str,
-    mode_body: str,
-    persona_body: str,
-    pattern: str,
-    turn_idx: int,
-    max_turns: int,
-    goal: str,
-    context: str,
-    summary: str,
-    thread_tail: List[Dict[str, Any]],
-    hitl_answers: Optional[Dict[str, Any]] = None,
-    enable_research: bool = False,
-) -> str:
-    """Build the prompt for an agent."""
-    thread_text = "\n".join(
-        f"[{m.get('agent', '?')}|{m.get('status', '?')}] {m.get('content', '')[:DEFAULT_MESSAGE_TRUNCATE_LENGTH]}"
-        for m in thread_tail[-DEFAULT_THREAD_HISTORY_COUNT:]
-    )
-
-    answers_section = ""
-    if hitl_answers:
-        answers_section = f"""
-HUMAN ANSWERS TO PREVIOUS QUESTIONS
-{json.dumps(hitl_answers, indent=2)}
-"""
-
-    return f"""\
+AGENT_PROMPT_HEADER = """\
 SYSTEM CONTEXT
 You are agent "{agent_name}" in a multi-agent orchestration system.
 Mode: {mode} | Pattern: {pattern} | Turn: {turn_idx}/{max_turns}
 
+"""
+
+# The part of the agent prompt that stays the same from turn to turn
+AGENT_PROMPT_BODY = """\
 {mode_body}
 
 {persona_body}
 
 GOAL
-{goal.strip()}
+{goal}
 
 SHARED CONTEXT
-{context.strip()}
+{context}
 
 ROLLING SUMMARY
-{summary.strip() if summary else "(none)"}
+{summary}
+
+"""
 
+AGENT_PROMPT_TAIL = """\
 CONVERSATION THREAD (recent)
-{thread_text if thread_text else "(start of conversation)"}
+{thread_text}
 {answers_section}
 
 OUTPUT REQUIREMENTS
@@ -914,29 +1212,148 @@ Respond with a SINGLE JSON object (no markdown, no extra text):
 - If you need human clarification, set status="needs_human" with questions
 - If the goal is fully satisfied, set status="done"
 - Include confidence (0.0-1.0) when making assessments
-- Use agrees_with to indicate consensus with other agents
-{f'- If you need web research to inform your response, set status="needs_research" with research_topics' if enable_research else ''}
-""".strip()
+- Use agrees_with to indicate consensus with other agents{research_hint}"""
+
+AGENT_RESEARCH_HINT = (
+    "\n- If you need web research to inform your response, "
+    'set status="needs_research" with research_topics'
+)
+
+AGENT_ANSWERS_SECTION = """
+HUMAN ANSWERS TO PREVIOUS QUESTIONS
+{answers}
+"""
+
+
+def format_thread_line(entry: ThreadEntry) -> str:
+    """Format one thread entry as a CONVERSATION THREAD line."""
+    return f"[{entry.agent}|{entry.status}] {entry.content[:DEFAULT_MESSAGE_TRUNCATE_LENGTH]}"
 
 
-def tail_thread(thread_path: Path, n: int = 20) -> List[Dict[str, Any]]:
-    """Read last N entries from thread JSONL."""
-    if not thread_path.exists():
-        return []
-    lines = thread_path.read_text(encoding="utf-8").splitlines()
+class ThreadTailCache:
+    """The most recent thread entries, pre-formatted for the agent prompt.
+
+    The orchestrator appends each entry here as it records it, so building a
+    prompt doesn't re-read the thread or re-format entries it has seen before.
+    """
+
+    def __init__(
+        self,
+        entries: Optional[List[ThreadEntry]] = None,
+        maxlen: int = DEFAULT_THREAD_HISTORY_COUNT,
+    ) -> None:
+        self.lines: deque[str] = deque(
+            (format_thread_line(e) for e in entries or []), maxlen=maxlen
+        )
+        self._text: Optional[str] = None
+
+    def append(self, entry: ThreadEntry) -> None:
+        self.lines.append(format_thread_line(entry))
+        self._text = None
+
+    def text(self) -> str:
+        # Joined once per change: every agent in a turn asks for the same text
+        if self._text is None:
+            self._text = "\n".join(self.lines)
+        return self._text
+
+
+@functools.lru_cache(maxsize=64)
+def _render_prompt_body(
+    mode_body: str, persona_body: str, goal: str, context: str, summary: str
+) -> str:
+    """AGENT_PROMPT_BODY for these inputs.
+
+    Cached: the inputs are loaded once per run, so each (agent, persona)
+    renders its body once rather than every turn.
+    """
+    return AGENT_PROMPT_BODY.format(
+        mode_body=mode_body,
+        persona_body=persona_body,
+        goal=goal.strip(),
+        context=context.strip(),
+        summary=summary.strip() if summary else "(none)",
+    )
+
+
+# The last rendered AGENT_PROMPT_TAIL. It doesn't depend on the agent, so the
+# agents of one turn share it; only one entry is kept as the thread moves on.
+_rendered_prompt_tail: Dict[Tuple[str, str, bool], str] = {}
+
+
+def build_prompt(
+    agent_name: str,
+    mode: str,
+    mode_body: str,
+    persona_body: str,
+    pattern: str,
+    turn_idx: int,
+    max_turns: int,
+    goal: str,
+    context: str,
+    summary: str,
+    thread_tail: Union[List[ThreadEntry], ThreadTailCache],
+    hitl_answers: Optional[Dict[str, Any]] = None,
+    enable_research: bool = False,
+) -> str:
+    """Build the prompt for an agent.
+
+    thread_tail is either recent thread entries or a ThreadTailCache.
+    """
+    if isinstance(thread_tail, ThreadTailCache):
+        thread_text = thread_tail.text()
+    else:
+        thread_text = "\n".join([
+            format_thread_line(m) for m in thread_tail[-DEFAULT_THREAD_HISTORY_COUNT:]
+        ])
+
+    answers_section = ""
+    if hitl_answers:
+        answers_section = AGENT_ANSWERS_SECTION.format(
+            answers=json.dumps(hitl_answers, indent=2)
+        )
+
+    body = _render_prompt_body(mode_body, persona_body, goal, context, summary)
+
+    tail_key = (thread_text, answers_section, enable_research)
+    tail = _rendered_prompt_tail.get(tail_key)
+    if tail is None:
+        tail = AGENT_PROMPT_TAIL.format(
+            thread_text=thread_text if thread_text else "(start of conversation)",
+            answers_section=answers_section,
+            research_hint=AGENT_RESEARCH_HINT if enable_research else "",
+        )
+        _rendered_prompt_tail.clear()
+        _rendered_prompt_tail[tail_key] = tail
+
+    return "".join((
+        AGENT_PROMPT_HEADER.format(
+            agent_name=agent_name,
+            mode=mode,
+            pattern=pattern,
+            turn_idx=turn_idx,
+            max_turns=max_turns,
+        ),
+        body,
+        tail,
+    ))
+
+
+def tail_thread(thread_path: Path, n: int = 20) -> List[ThreadEntry]:
+    """Read last N entries from thread JSONL (only the tail of the file is read)."""
     out = []
-    for line in lines[-n:]:
+    for line in read_last_lines(thread_path, n):
         try:
-            obj = json.loads(line)
+            obj = json_loads(line)
             if isinstance(obj, dict):
-                out.append(obj)
-        except json.JSONDecodeError:
+                out.append(ThreadEntry.from_dict(obj))
+        except ValueError:  # bad JSON or bad UTF-8
             continue
     return out
 
 
 def detect_stagnation(
-    thread_tail: List[Dict[str, Any]], agents: List[str], threshold: float = 0.90
+    thread_tail: List[ThreadEntry], agents: List[str], threshold: float = 0.90
 ) -> bool:
     """Detect if last two rounds are too similar (stagnation)."""
     # Need at least 2 agents to detect meaningful stagnation
@@ -946,9 +1363,9 @@ def detect_stagnation(
     # Get last messages per agent for last 2 rounds
     agent_msgs: Dict[str, List[str]] = {a: [] for a in agents}
     for entry in reversed(thread_tail):
-        agent = entry.get("agent", "")
+        agent = entry.agent
         if agent in agent_msgs and len(agent_msgs[agent]) < 2:
-            agent_msgs[agent].append(entry.get("content", ""))
+            agent_msgs[agent].append(entry.content)
 
     # Need at least 2 messages per agent to compare
     agents_with_history = [a for a, msgs in agent_msgs.items() if len(msgs) >= 2]
@@ -958,8 +1375,7 @@ def detect_stagnation(
     # Check similarity for each agent
     for agent in agents_with_history:
         msgs = agent_msgs[agent]
-        sim = text_similarity(msgs[0], msgs[1])
-        if sim < threshold:
+        if not texts_similar(msgs[0], msgs[1], threshold, inclusive=True):
             return False  # Significant change detected
 
     return True  # All agents stagnated
@@ -980,15 +1396,21 @@ def check_consensus(envelopes: Dict[str, Envelope], min_agree: int = 2) -> bool:
             if len(agreers & set(agents)) >= min_agree:
                 return True
 
-    # Fallback: check message similarity
-    messages = [(a, envelopes[a].message) for a in agents]
-    for i, (a1, m1) in enumerate(messages):
-        similar_count = 1
-        for j, (a2, m2) in enumerate(messages):
-            if i != j and text_similarity(m1, m2) > 0.85:
-                similar_count += 1
+    # Fallback: check message similarity. Identical messages always agree, so
+    # they're grouped and each distinct message is scored against the others.
+    # ratio() depends on argument order, so every ordered pair is checked with
+    # the counted message first, as the per-agent comparison always did.
+    message_counts = Counter(envelopes[a].message for a in agents)
+    messages = list(message_counts)
+    for i, message in enumerate(messages):
+        similar_count = message_counts[message]
         if similar_count >= min_agree:
             return True
+        for j, other in enumerate(messages):
+            if i != j and texts_similar(message, other, 0.85):
+                similar_count += message_counts[other]
+                if similar_count >= min_agree:
+                    return True
 
     return False
 
@@ -1005,24 +1427,35 @@ async def run_multi_phase_orchestrator(
     run_dir: Path,
     agents: Dict[str, Agent],
     phases_config: Dict[str, Any],
+    thread_log: JsonlBatcher,
     genloop_cfg: Optional[GenloopConfig] = None,
 ) -> int:
-    """Run multi-phase orchestration (Generate → Critique → Adjudicate → Refine loop)."""
-    thread_path = run_dir / "thread.jsonl"
+    """Run multi-phase orchestration (Generate → Critique → Adjudicate → Refine loop).
+
+    thread_log is the run's thread.jsonl writer; the caller closes it.
+    """
+    from genloop_config import get_agents_for_constraint
+
+    def log_thread(entry: Dict[str, Any]) -> None:
+        """Append one entry to thread.jsonl durably."""
+        thread_log.append(entry)
+        thread_log.flush()
     state_path = run_dir / "state.json"
 
-    # Load state for resuming
-    state = load_json(
+    # Load state for resuming. Mid-phase counter bumps are journaled; every
+    # phase change and HITL transition checkpoints the full state.json.
+    journal = StateJournal(
         state_path,
         {
             "awaiting_human": False,
             "iteration": 1,
             "phase": "generate",
-            "artifact": None,
-            "critiques": [],
+            "artifact_path": None,
+            "critique_paths": [],
             "adjudication": None,
         },
     )
+    state = journal.state
 
     # HITL directory for this run
     hitl_dir = run_dir / "hitl"
@@ -1034,7 +1467,7 @@ async def run_multi_phase_orchestrator(
         if getattr(args, "reset_hitl", False):
             # Manual override: clear stale HITL state
             state["awaiting_human"] = False
-            save_json_atomic(state_path, state)
+            journal.checkpoint()
             write_live("HITL state cleared via --reset-hitl")
             logger.info("HITL state cleared via --reset-hitl flag")
         else:
@@ -1042,11 +1475,9 @@ async def run_multi_phase_orchestrator(
             if hitl_answers:
                 state["awaiting_human"] = False
                 # Add answers to thread
-                append_jsonl_durable(
-                    thread_path,
+                log_thread(
                     {
-                        "id": sha256(f"human:{utc_now_iso()}"),
-                        "ts": utc_now_iso(),
+                        **thread_event_header("human"),
                         "iteration": state.get("iteration", 1),
                         "phase": "hitl_response",
                         "agent": "human",
@@ -1054,19 +1485,19 @@ async def run_multi_phase_orchestrator(
                         "content": json.dumps(hitl_answers),
                     },
                 )
-                save_json_atomic(state_path, state)
+                journal.checkpoint()
                 write_live("=" * 60)
                 write_live("RESUMING: Human answers received")
                 write_live("=" * 60)
             elif not (hitl_dir / "questions.json").exists():
                 # Phantom HITL: awaiting_human is set but questions.json is gone
                 state["awaiting_human"] = False
-                save_json_atomic(state_path, state)
+                journal.checkpoint()
                 write_live("Cleared stale HITL state (no questions.json found)")
                 logger.warning("Cleared phantom HITL state: awaiting_human was true but questions.json missing")
             else:
-                logger.info(f"Awaiting human answers at {hitl_dir / 'answers.json'}")
-                logger.info(f"See questions at {hitl_dir / 'questions.json'}")
+                logger.info("Awaiting human answers at %s", hitl_dir / "answers.json")
+                logger.info("See questions at %s", hitl_dir / "questions.json")
                 return EXIT_HITL
 
     # Load inputs
@@ -1077,11 +1508,13 @@ async def run_multi_phase_orchestrator(
         allow_scripts=False,
     )
     if not loaded_goal or not loaded_goal.goal_text.strip():
-        logger.error(f"No goal defined in {run_dir / 'goal.yaml'} (or legacy goal.md)")
+        logger.error("No goal defined in %s (or legacy goal.md)", run_dir / "goal.yaml")
         return EXIT_ERROR
 
     goal = loaded_goal.goal_text
     source = loaded_goal.source_content
+    # Truncated once here; build_critic_prompt's own slice is then a no-op
+    critic_goal = goal[:CRITIC_GOAL_MAX_LENGTH]
     constraints = load_constraints(run_dir / "constraints")
 
     if not constraints:
@@ -1105,6 +1538,7 @@ async def run_multi_phase_orchestrator(
     termination_config = phases_config.get("termination", {})
     approve_when = termination_config.get("approve_when", "no_critical_and_no_high")
     thrash_threshold = termination_config.get("thrash_threshold", 2)  # Escalate after N occurrences
+    escalate_on = frozenset(termination_config.get("escalate_on", []))
 
     # Agent configuration
     generate_agent_name = phases_config.get("generate", {}).get("agent", "claude")
@@ -1113,7 +1547,7 @@ async def run_multi_phase_orchestrator(
 
     # Apply genloop config overrides (genloop config takes priority)
     if genloop_cfg:
-        logger.info(f"Applying genloop config from {genloop_cfg.source_path}")
+        logger.info("Applying genloop config from %s", genloop_cfg.source_path)
 
         # Override max_iterations
         if genloop_cfg.max_iterations != 3:  # Non-default value
@@ -1153,9 +1587,28 @@ async def run_multi_phase_orchestrator(
     # Validate agents exist
     for agent_name in [generate_agent_name, adjudicate_agent_name] + critique_agents:
         if agent_name not in agents:
-            logger.error(f"Agent '{agent_name}' not found in configuration")
+            logger.error("Agent '%s' not found in configuration", agent_name)
             return EXIT_ERROR
 
+    # Route constraints to critic agents once: routing is fixed for the run.
+    # Uses genloop config routing if available, otherwise falls back to critique_agents
+    constraint_routing = [
+        (constraint, get_agents_for_constraint(
+            constraint, genloop_cfg, available_agents=critique_agents
+        ) if genloop_cfg else critique_agents)
+        for constraint in constraints
+    ]
+
+    # The critique phase only runs configured agents
+    critic_routing = []
+    for constraint, constraint_agents in constraint_routing:
+        for agent_name in constraint_agents:
+            if agent_name not in agents:
+                logger.warning("Agent '%s' not configured, skipping for %s", agent_name, constraint.id)
+        critic_routing.append(
+            (constraint, [a for a in constraint_agents if a in agents])
+        )
+
     # Log configuration
     write_live("=" * 60)
     write_live(f"RELIABLE GENERATION: {run_dir.name}")
@@ -1186,15 +1639,7 @@ async def run_multi_phase_orchestrator(
         if constraints:
             routing_label = "config-based" if genloop_cfg else "all-to-all"
             write_live(f"CONSTRAINT ROUTING ({routing_label}):")
-            total_critiques = 0
-            constraint_routing = []
-            for constraint in constraints:
-                # Get agents for this constraint using config routing
-                constraint_agents = get_agents_for_constraint(
-                    constraint, genloop_cfg, available_agents=critique_agents
-                ) if genloop_cfg else critique_agents
-                total_critiques += len(constraint_agents)
-                constraint_routing.append((constraint, constraint_agents))
+            total_critiques = sum(len(routing_agents) for _, routing_agents in constraint_routing)
 
             write_live(f"  {len(constraints)} constraints, {total_critiques} critique tasks")
             write_live("")
@@ -1232,10 +1677,35 @@ async def run_multi_phase_orchestrator(
     # Resume from saved state
     iteration = state.get("iteration", 1)
     current_phase = state.get("phase", "generate")
-    artifact = state.get("artifact")
-    critiques = [Critique.from_dict(c) for c in state.get("critiques", [])]
+    # The artifact text lives in its iteration file; state only points at it
+    # (states written before that may still carry the text itself)
+    artifact_path_str = state.get("artifact_path")
+    if artifact_path_str:
+        try:
+            artifact = Path(artifact_path_str).read_text(encoding="utf-8")
+        except OSError as e:
+            logger.error("Cannot resume: saved artifact could not be read: %s", e)
+            return EXIT_ERROR
+    else:
+        artifact = state.pop("artifact", None)
+    # Critiques are on disk in the iteration's critiques/ dir; state lists
+    # their files (states written before that may still embed them)
+    critiques: List[Critique] = []
+    if state.get("critique_paths"):
+        for critique_path in state["critique_paths"]:
+            critique_data = load_json(Path(critique_path), None)
+            if not isinstance(critique_data, dict):
+                logger.warning("Skipping saved critique %s: file is missing or invalid", critique_path)
+                continue
+            critiques.append(Critique.from_dict(critique_data))
+    else:
+        critiques = [Critique.from_dict(c) for c in state.pop("critiques", [])]
     adjudication = Adjudication.from_dict(state["adjudication"]) if state.get("adjudication") else None
 
+    # Previous iteration's verdict for the thrash check (None until this run
+    # completes an adjudication; read from disk when resuming)
+    prev_adjudication: Optional[Adjudication] = None
+
     # Main iteration loop
     while iteration <= max_iterations:
         iter_dir = run_dir / "iterations" / str(iteration)
@@ -1254,7 +1724,7 @@ async def run_multi_phase_orchestrator(
 
                 # Copy previous artifact to current iteration dir
                 prev_artifact_path = run_dir / "iterations" / str(iteration - 1) / "artifact.md"
-                shutil.copy(prev_artifact_path, curr_artifact_path)
+                copy_file_contents(prev_artifact_path, curr_artifact_path)
 
                 prompt = build_refinement_prompt(
                     artifact_path=curr_artifact_path,
@@ -1278,7 +1748,7 @@ async def run_multi_phase_orchestrator(
                 )
 
             # Save prompt
-            write_text_atomic(iter_dir / f"prompt_generate_{generate_agent_name}.txt", prompt)
+            write_text_fast(iter_dir / f"prompt_generate_{generate_agent_name}.txt", prompt)
 
             # Run generator
             agent = agents[generate_agent_name]
@@ -1294,15 +1764,23 @@ async def run_multi_phase_orchestrator(
                 if "--add-dir" not in generator_cmd:
                     generator_cmd.extend(["--add-dir", str(run_dir)])
 
-            logger.debug(f"Generator command: {' '.join(generator_cmd)}")
+            logger.debug("Generator command: %s", " ".join(generator_cmd))
+            # Regenerated output is written straight into the artifact file
+            # as it arrives, so it can be followed while the generator runs
+            stream_to_artifact = not (is_refinement and refine_mode == "edit")
             rc, stdout, stderr = await run_process(
                 generator_cmd, prompt, agent.timeout,
                 stream_prefix=generate_agent_name if not args.no_stream else None,
                 suppress_stderr=agent.suppress_stderr,
+                output_path=curr_artifact_path if stream_to_artifact else None,
             )
+            if stream_to_artifact:
+                stdout = curr_artifact_path.read_bytes().decode("utf-8", errors="replace")
 
             if rc != 0 and not stdout.strip():
-                logger.error(f"Generator failed: {stderr[:500]}")
+                logger.error("Generator failed: %s", stderr[:500])
+                if stream_to_artifact:
+                    curr_artifact_path.unlink(missing_ok=True)
                 return EXIT_ERROR
 
             # For edit mode, read the (potentially edited) artifact from file
@@ -1335,14 +1813,13 @@ async def run_multi_phase_orchestrator(
                         write_hitl_questions(run_dir, hitl_questions, iteration)
                         state["awaiting_human"] = True
                         state["validation_retries"] = retry_count
-                        save_json_atomic(state_path, state)
+                        journal.checkpoint()
                         logger.info("HITL requested due to validation failure")
                         write_agent_result(run_dir, "needs_human", EXIT_HITL, questions=hitl_questions)
                         return EXIT_HITL
 
                     # Retry refinement
-                    state["validation_retries"] = retry_count
-                    save_json_atomic(state_path, state)
+                    journal.update({"validation_retries": retry_count})
                     write_live(f"  ℹ Retrying refinement (attempt {retry_count + 1}/{validation_retries})")
                     continue
                 else:
@@ -1351,18 +1828,17 @@ async def run_multi_phase_orchestrator(
             else:
                 artifact = stdout.strip()
 
-            write_text_atomic(curr_artifact_path, artifact)
+            artifact_bytes = artifact.encode("utf-8")
+            write_bytes_atomic(curr_artifact_path, artifact_bytes)
 
-            token_count = len(artifact.split())
+            token_count = count_words(artifact_bytes)
             phase_label = "Refined" if is_refinement else "Generated"
             write_live(f"  ✓ {phase_label} artifact (~{token_count} words)")
 
             # Append to thread
-            append_jsonl_durable(
-                thread_path,
+            log_thread(
                 {
-                    "id": sha256(f"generator:{utc_now_iso()}:{iteration}"),
-                    "ts": utc_now_iso(),
+                    **thread_event_header(f"generator:{iteration}"),
                     "iteration": iteration,
                     "phase": "refine" if is_refinement else "generate",
                     "agent": generate_agent_name,
@@ -1373,10 +1849,10 @@ async def run_multi_phase_orchestrator(
             )
 
             # Update state
-            state["artifact"] = artifact
+            state["artifact_path"] = str(curr_artifact_path)
             state["phase"] = "critique"
-            state["critiques"] = []
-            save_json_atomic(state_path, state)
+            state["critique_paths"] = []
+            journal.checkpoint()
 
             current_phase = "critique"
 
@@ -1392,6 +1868,10 @@ async def run_multi_phase_orchestrator(
             critique_tasks = []
             task_info = []
 
+            # Optional cap on concurrently running critics (0 = no limit)
+            max_concurrent = genloop_cfg.phases.critique.max_concurrent if genloop_cfg else 0
+            critic_slots = asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else contextlib.nullcontext()
+
             # Calculate project_root (parent of state_dir, which is .arena)
             project_root = state_dir.parent
             artifact_path = iter_dir / "artifact.md"
@@ -1399,77 +1879,96 @@ async def run_multi_phase_orchestrator(
             # Get arena_home for source resolution
             arena_home = global_dir if global_dir else Path.home() / ".arena"
 
-            for constraint in constraints:
-                # Determine which agents should critique this constraint
-                # Uses genloop config routing if available, otherwise falls back to critique_agents
-                constraint_agents = get_agents_for_constraint(
-                    constraint, genloop_cfg, available_agents=critique_agents
-                ) if genloop_cfg else critique_agents
-
-                for agent_name in constraint_agents:
-                    if agent_name not in agents:
-                        logger.warning(f"Agent '{agent_name}' not configured, skipping for {constraint.id}")
-                        continue
-
-                    agent = agents[agent_name]
-                    prompt = build_critic_prompt(
-                        constraint=constraint,
-                        artifact=artifact,
-                        goal=goal,
-                        iteration=iteration,
-                        run_dir=run_dir,
-                        project_root=project_root,
-                        artifact_path=artifact_path,
-                        allow_scripts=args.allow_scripts if hasattr(args, 'allow_scripts') else False,
-                        arena_home=arena_home,
-                    )
-
-                    write_text_atomic(
+            def prepare_critic_prompt(constraint: Constraint, agent_names: List[str]) -> str:
+                """Build a constraint's critic prompt and save a copy per agent.
+
+                The prompt doesn't depend on the agent, so it's built once per
+                constraint. Runs in a worker thread (source resolution may read
+                files or run scripts), overlapping with critics already running.
+                """
+                prompt = build_critic_prompt(
+                    constraint=constraint,
+                    artifact=artifact,
+                    goal=critic_goal,
+                    iteration=iteration,
+                    run_dir=run_dir,
+                    project_root=project_root,
+                    artifact_path=artifact_path,
+                    allow_scripts=args.allow_scripts if hasattr(args, 'allow_scripts') else False,
+                    arena_home=arena_home,
+                )
+                for agent_name in agent_names:
+                    write_text_fast(
                         critiques_dir / f"prompt_{constraint.id}_{agent_name}.txt",
                         prompt,
                     )
+                return prompt
+
+            async def run_critic(
+                agent: Agent, prompt_task: "asyncio.Future[str]", stream_prefix: Optional[str]
+            ) -> Tuple[int, str, str]:
+                """Run one critic once its prompt is built, waiting for a free slot when concurrency is capped."""
+                prompt = await prompt_task
+                async with critic_slots:
+                    return await run_process(
+                        agent.cmd, prompt, agent.timeout,
+                        stream_prefix=stream_prefix,
+                        suppress_stderr=agent.suppress_stderr,
+                    )
 
+            for constraint, constraint_agents in critic_routing:
+                if not constraint_agents:
+                    continue
+                prompt_task = asyncio.ensure_future(
+                    asyncio.to_thread(prepare_critic_prompt, constraint, constraint_agents)
+                )
+                for agent_name in constraint_agents:
                     write_live(f"  {agent_name} ({constraint.id}) → reviewing...")
 
                     critique_tasks.append(
-                        run_process(
-                            agent.cmd, prompt, agent.timeout,
-                            stream_prefix=f"{agent_name}[{constraint.id}]" if not args.no_stream else None,
-                            suppress_stderr=agent.suppress_stderr,
+                        run_critic(
+                            agents[agent_name], prompt_task,
+                            f"{agent_name}[{constraint.id}]" if not args.no_stream else None,
                         )
                     )
                     task_info.append((agent_name, constraint))
 
-            # Run all critiques in parallel
+            # Run all critiques concurrently (bounded by max_concurrent, if set)
             results = await asyncio.gather(*critique_tasks)
 
+            # Thread entries for the whole phase go out in one write+fsync
+            # (sharing one timestamp), and the per-critique summaries in one
+            # live-log write
             critiques = []
+            critique_paths = []
+            summary_lines = []
+            batch_ts = utc_now_iso()
             for (rc, stdout, stderr), (agent_name, constraint) in zip(results, task_info):
                 critique = parse_critique(stdout, agent_name, constraint.id, iteration)
                 critiques.append(critique)
 
                 # Save critique output
-                save_json_atomic(
-                    critiques_dir / f"{constraint.id}-{agent_name}.json",
-                    critique.to_dict(),
-                )
+                critique_path = critiques_dir / f"{constraint.id}-{agent_name}.json"
+                save_json_atomic(critique_path, critique.to_dict())
+                critique_paths.append(str(critique_path))
 
                 # Log summary
                 issue_count = len(critique.issues)
-                critical_count = sum(1 for i in critique.issues if i.severity == "CRITICAL")
-                high_count = sum(1 for i in critique.issues if i.severity == "HIGH")
-
                 if issue_count > 0:
-                    write_live(f"  {agent_name} ({constraint.id}): {critical_count} CRITICAL, {high_count} HIGH, {issue_count - critical_count - high_count} other")
+                    severities = Counter(i.severity for i in critique.issues)
+                    critical_count = severities["CRITICAL"]
+                    high_count = severities["HIGH"]
+                    summary_lines.append(CRITIQUE_SUMMARY_LINE.format(
+                        agent=agent_name, cid=constraint.id, crit=critical_count,
+                        high=high_count, other=issue_count - critical_count - high_count,
+                    ))
                 else:
-                    write_live(f"  {agent_name} ({constraint.id}): PASS")
+                    summary_lines.append(CRITIQUE_PASS_LINE.format(agent=agent_name, cid=constraint.id))
 
                 # Append to thread
-                append_jsonl_durable(
-                    thread_path,
+                thread_log.append(
                     {
-                        "id": sha256(f"critique:{agent_name}:{constraint.id}:{utc_now_iso()}"),
-                        "ts": utc_now_iso(),
+                        **thread_event_header(f"critique:{agent_name}:{constraint.id}", batch_ts),
                         "iteration": iteration,
                         "phase": "critique",
                         "agent": agent_name,
@@ -1481,10 +1980,13 @@ async def run_multi_phase_orchestrator(
                     },
                 )
 
+            thread_log.flush()
+            write_live_lines(summary_lines)
+
             # Update state
-            state["critiques"] = [c.to_dict() for c in critiques]
+            state["critique_paths"] = critique_paths
             state["phase"] = "adjudicate"
-            save_json_atomic(state_path, state)
+            journal.checkpoint()
 
             current_phase = "adjudicate"
 
@@ -1503,22 +2005,29 @@ async def run_multi_phase_orchestrator(
                 max_iterations=max_iterations,
             )
 
-            # Log context size for monitoring
-            context_tokens = len(prompt.split())
-            if context_tokens > 100000:  # Warn at ~100K words (rough proxy for tokens)
-                write_live(f"  ⚠ Large context: ~{context_tokens} words")
+            # The prompt carries the full artifact and every critique: encode it
+            # once and reuse the bytes for the word count, prompt file and stdin
+            prompt_bytes = prompt.encode("utf-8")
+            del prompt
+
+            # Log context size for monitoring. Every word takes at least two
+            # bytes with its separator, so smaller prompts aren't counted at all.
+            if len(prompt_bytes) > 2 * LARGE_CONTEXT_WORDS:
+                context_tokens = count_words(prompt_bytes)
+                if context_tokens > LARGE_CONTEXT_WORDS:
+                    write_live(f"  ⚠ Large context: ~{context_tokens} words")
 
-            write_text_atomic(iter_dir / f"prompt_adjudicate_{adjudicate_agent_name}.txt", prompt)
+            write_bytes_fast(iter_dir / f"prompt_adjudicate_{adjudicate_agent_name}.txt", prompt_bytes)
 
             agent = agents[adjudicate_agent_name]
             rc, stdout, stderr = await run_process(
-                agent.cmd, prompt, agent.timeout,
+                agent.cmd, prompt_bytes, agent.timeout,
                 stream_prefix=adjudicate_agent_name if not args.no_stream else None,
                 suppress_stderr=agent.suppress_stderr,
             )
 
             if rc != 0 and not stdout.strip():
-                logger.error(f"Adjudicator failed: {stderr[:500]}")
+                logger.error("Adjudicator failed: %s", stderr[:500])
                 return EXIT_ERROR
 
             adjudication = parse_adjudication(stdout, iteration)
@@ -1529,11 +2038,9 @@ async def run_multi_phase_orchestrator(
             write_live(f"    HIGH pursuing: {adjudication.high_pursuing}")
 
             # Append to thread
-            append_jsonl_durable(
-                thread_path,
+            log_thread(
                 {
-                    "id": sha256(f"adjudication:{utc_now_iso()}:{iteration}"),
-                    "ts": utc_now_iso(),
+                    **thread_event_header(f"adjudication:{iteration}"),
                     "iteration": iteration,
                     "phase": "adjudicate",
                     "agent": adjudicate_agent_name,
@@ -1562,50 +2069,62 @@ async def run_multi_phase_orchestrator(
 
             # Check for thrashing (same issues returning)
             if iteration >= 2:
-                prev_adjudication_path = run_dir / "iterations" / str(iteration - 1) / "adjudication.yaml"
-                if prev_adjudication_path.exists():
-                    prev_adj = Adjudication.from_dict(load_json(prev_adjudication_path, {}))
-                    prev_issues = {d.issue_id for d in prev_adj.decisions if d.status == "pursuing"}
+                if prev_adjudication is None:
+                    # Resumed run: the previous verdict is only on disk
+                    prev_adjudication_path = run_dir / "iterations" / str(iteration - 1) / "adjudication.yaml"
+                    if prev_adjudication_path.exists():
+                        prev_adjudication = Adjudication.from_dict(load_json(prev_adjudication_path, {}))
+                if prev_adjudication is not None:
+                    prev_issues = {d.issue_id for d in prev_adjudication.decisions if d.status == "pursuing"}
                     curr_issues = {d.issue_id for d in adjudication.decisions if d.status == "pursuing"}
 
-                    if prev_issues & curr_issues:
-                        overlapping = prev_issues & curr_issues
+                    # Nothing came back (the usual case): skip the bookkeeping
+                    overlapping = prev_issues & curr_issues
+                    if overlapping:
 
                         # Track per-issue thrash counts (starts at 0, increments on each overlap)
                         # First overlap = 1, second overlap = 2, etc.
-                        issue_thrash_counts = state.get("issue_thrash_counts", {})
+                        issue_thrash_counts, issue_id_map = load_thrash_counts(state)
                         chronic_thrashers = []
 
                         for issue_id in overlapping:
-                            issue_thrash_counts[issue_id] = issue_thrash_counts.get(issue_id, 0) + 1
-                            if issue_thrash_counts[issue_id] >= thrash_threshold:
-                                chronic_thrashers.append((issue_id, issue_thrash_counts[issue_id]))
-
-                        state["issue_thrash_counts"] = issue_thrash_counts
+                            idx = issue_id_map.setdefault(issue_id, len(issue_id_map))
+                            if idx == len(issue_thrash_counts):
+                                issue_thrash_counts.append(0)
+                            issue_thrash_counts[idx] += 1
+                            if issue_thrash_counts[idx] >= thrash_threshold:
+                                chronic_thrashers.append((issue_id, issue_thrash_counts[idx]))
+
+                        # The list and its index map are only meaningful together,
+                        # so they're always journaled in the same record
+                        journal.update({
+                            "issue_thrash_counts": issue_thrash_counts,
+                            "issue_id_map": issue_id_map,
+                        })
 
                         if chronic_thrashers:
-                            # Format thrash details for HITL question
-                            thrash_details = "\n".join(
-                                f"  - {issue_id}: seen {count} times"
-                                for issue_id, count in chronic_thrashers
-                            )
-                            # Get guidance for thrashing issues
-                            issue_guidance = {}
-                            for d in adjudication.decisions:
-                                if d.issue_id in [t[0] for t in chronic_thrashers]:
-                                    issue_guidance[d.issue_id] = d.guidance or "No specific guidance"
-
-                            guidance_details = "\n".join(
-                                f"  - {issue_id}: {guidance}"
-                                for issue_id, guidance in issue_guidance.items()
-                            )
-
                             write_live(f"  ⚠ Chronic thrashing on {len(chronic_thrashers)} issues")
                             for issue_id, count in chronic_thrashers:
                                 write_live(f"    - {issue_id}: seen {count} times")
 
                             # Check for HITL escalation
-                            if "thrashing" in termination_config.get("escalate_on", []):
+                            if "thrashing" in escalate_on:
+                                # Format thrash details for HITL question
+                                thrash_details = "\n".join(
+                                    f"  - {issue_id}: seen {count} times"
+                                    for issue_id, count in chronic_thrashers
+                                )
+                                # Get guidance for thrashing issues
+                                chronic_ids = {issue_id for issue_id, _ in chronic_thrashers}
+                                issue_guidance = {}
+                                for d in adjudication.decisions:
+                                    if d.issue_id in chronic_ids:
+                                        issue_guidance[d.issue_id] = d.guidance or "No specific guidance"
+
+                                guidance_details = "\n".join(
+                                    f"  - {issue_id}: {guidance}"
+                                    for issue_id, guidance in issue_guidance.items()
+                                )
                                 curr_artifact_path = iter_dir / "artifact.md"
                                 hitl_questions = [{
                                     "agent": "orchestrator",
@@ -1629,17 +2148,16 @@ Options:
                                 write_hitl_questions(run_dir, hitl_questions, iteration)
                                 state["awaiting_human"] = True
                                 state["adjudication"] = adjudication.to_dict()
-                                save_json_atomic(state_path, state)
+                                journal.checkpoint()
                                 logger.info("HITL requested due to chronic thrashing")
                                 write_agent_result(run_dir, "needs_human", EXIT_HITL, questions=hitl_questions)
                                 return EXIT_HITL
                         else:
                             # First occurrence of overlap - log but continue
                             write_live(f"  ℹ Issues reappeared (count < {thrash_threshold}): {overlapping}")
-                            save_json_atomic(state_path, state)
 
             # Check for conflicting criticals requiring HITL
-            if "conflicting_criticals" in termination_config.get("escalate_on", []):
+            if "conflicting_criticals" in escalate_on:
                 critical_issues = [d for d in adjudication.decisions if d.severity == "CRITICAL" and d.status == "pursuing"]
                 if len(critical_issues) > 1:
                     # Check if any compete
@@ -1658,16 +2176,17 @@ Options:
                             write_hitl_questions(run_dir, hitl_questions, iteration)
                             state["awaiting_human"] = True
                             state["adjudication"] = adjudication.to_dict()
-                            save_json_atomic(state_path, state)
+                            journal.checkpoint()
                             logger.info("HITL requested due to conflicting criticals")
                             write_agent_result(run_dir, "needs_human", EXIT_HITL, questions=hitl_questions)
                             return EXIT_HITL
 
             # Update state for next iteration
+            prev_adjudication = adjudication
             state["adjudication"] = adjudication.to_dict()
             state["phase"] = "generate"
             state["iteration"] = iteration + 1
-            save_json_atomic(state_path, state)
+            journal.checkpoint()
 
             iteration += 1
             current_phase = "generate"
@@ -1689,7 +2208,7 @@ Options:
     write_text_atomic(final_dir / "artifact.md", artifact)
     write_text_atomic(final_dir / "status.md", f"# Status: MAX_ITERATIONS\n\nReached {max_iterations} iterations without full approval.\n\nRemaining issues:\n{adjudication.bill_of_work if adjudication else 'Unknown'}")
 
-    if "max_iterations" in termination_config.get("escalate_on", []):
+    if "max_iterations" in escalate_on:
         # Escalate to human for decision
         hitl_questions = [{
             "agent": "orchestrator",
@@ -1702,7 +2221,7 @@ Options:
         }]
         write_hitl_questions(run_dir, hitl_questions, iteration)
         state["awaiting_human"] = True
-        save_json_atomic(state_path, state)
+        journal.checkpoint()
         write_agent_result(run_dir, "needs_human", EXIT_HITL, questions=hitl_questions)
         return EXIT_HITL
     else:
@@ -1729,9 +2248,9 @@ async def run_orchestrator(args: argparse.Namespace) -> int:
     if args.profile:
         profile = load_profile(state_dir, args.profile, global_dir)
         if profile:
-            logger.info(f"Loaded profile: {args.profile}")
+            logger.info("Loaded profile: %s", args.profile)
             if profile.get("description"):
-                logger.info(f"  {profile['description']}")
+                logger.info("  %s", profile["description"])
             cfg = merge_profile(cfg, profile)
 
             # Apply profile settings to args (if not overridden on CLI)
@@ -1782,19 +2301,16 @@ async def _run_orchestrator_locked(
     ensure_secure_dir(run_dir)
 
     # Create/update runs/latest symlink for run discovery
-    latest_link = state_dir / "runs" / "latest"
-    if latest_link.is_symlink() or latest_link.exists():
-        latest_link.unlink()
-    latest_link.symlink_to(run_name)  # relative symlink within runs/
+    replace_symlink(state_dir / "runs" / "latest", run_name)  # relative symlink within runs/
 
     # Check for goal file in run directory (prefer goal.yaml, fallback to goal.md)
-    goal_yaml_path = run_dir / "goal.yaml"
     goal_md_path = run_dir / "goal.md"
-    if is_new_run and not goal_yaml_path.exists() and not goal_md_path.exists():
-        # Create template goal.yaml for user to edit
+    if is_new_run and not goal_md_path.exists():
+        # Create template goal.yaml for user to edit (unless one is already there)
         goal_path = create_goal_template(run_dir)
-        logger.info(f"Created {goal_path} - edit it and re-run")
-        return EXIT_ERROR
+        if goal_path is not None:
+            logger.info("Created %s - edit it and re-run", goal_path)
+            return EXIT_ERROR
 
     # Open live log in run directory (append if resuming)
     live_log_path = run_dir / "live.log"
@@ -1802,19 +2318,20 @@ async def _run_orchestrator_locked(
     set_live_log(live_log_file)
 
     # Create/update symlink in state_dir root for easy access
-    live_link = state_dir / "live.log"
-    if live_link.is_symlink() or live_link.exists():
-        live_link.unlink()
-    live_link.symlink_to(live_log_path.relative_to(state_dir))
+    replace_symlink(state_dir / "live.log", live_log_path.relative_to(state_dir))
 
     write_live("=" * 60)
     write_live(f"ARENA ORCHESTRATOR - {run_name}")
     write_live(f"Watch: tail -f {state_dir}/live.log")
     write_live("=" * 60)
 
+    thread_log = JsonlBatcher(run_dir / "thread.jsonl")
     try:
-        return await _run_orchestrator_inner(args, cfg, state_dir, global_dir, run_dir)
+        return await _run_orchestrator_inner(
+            args, cfg, state_dir, global_dir, run_dir, thread_log
+        )
     finally:
+        thread_log.close()
         write_live("=" * 60)
         write_live("ORCHESTRATOR FINISHED")
         write_live("=" * 60)
@@ -1828,16 +2345,23 @@ async def _run_orchestrator_inner(
     state_dir: Path,
     global_dir: Optional[Path],
     run_dir: Path,
+    thread_log: JsonlBatcher,
 ) -> int:
-    """Inner orchestrator logic."""
-    thread_path = run_dir / "thread.jsonl"
+    """Inner orchestrator logic.
+
+    Thread entries go through thread_log and are flushed before the thread is
+    read back; the caller flushes whatever is left on exit.
+    """
+    thread_path = thread_log.path
     state_path = run_dir / "state.json"
 
-    # Load state (for resuming interrupted runs)
-    state = load_json(
+    # Load state (for resuming interrupted runs). The per-turn counters are
+    # journaled; HITL transitions and run exits checkpoint the full state.json.
+    journal = StateJournal(
         state_path,
         {"awaiting_human": False, "turn": 0, "done_agents": [], "done_cycle": -1},
     )
+    state = journal.state
 
     # HITL directory for this run
     hitl_dir = run_dir / "hitl"
@@ -1853,7 +2377,7 @@ async def _run_orchestrator_inner(
         if getattr(args, "reset_hitl", False):
             # Manual override: clear stale HITL state
             state["awaiting_human"] = False
-            save_json_atomic(state_path, state)
+            journal.checkpoint()
             write_live("HITL state cleared via --reset-hitl")
             logger.info("HITL state cleared via --reset-hitl flag")
         else:
@@ -1861,11 +2385,9 @@ async def _run_orchestrator_inner(
             if hitl_answers:
                 state["awaiting_human"] = False
                 # Add answers to thread
-                append_jsonl_durable(
-                    thread_path,
+                thread_log.append(
                     {
-                        "id": sha256(f"human:{utc_now_iso()}"),
-                        "ts": utc_now_iso(),
+                        **thread_event_header("human"),
                         "turn": state["turn"],
                         "agent": "human",
                         "role": "user",
@@ -1873,16 +2395,17 @@ async def _run_orchestrator_inner(
                         "content": json.dumps(hitl_answers),
                     },
                 )
-                save_json_atomic(state_path, state)
+                thread_log.flush()
+                journal.checkpoint()
             elif not (hitl_dir / "questions.json").exists():
                 # Phantom HITL: awaiting_human is set but questions.json is gone
                 state["awaiting_human"] = False
-                save_json_atomic(state_path, state)
+                journal.checkpoint()
                 write_live("Cleared stale HITL state (no questions.json found)")
                 logger.warning("Cleared phantom HITL state: awaiting_human was true but questions.json missing")
             else:
-                logger.info(f"Awaiting human answers at {hitl_dir / 'answers.json'}")
-                logger.info(f"See questions at {hitl_dir / 'questions.json'}")
+                logger.info("Awaiting human answers at %s", hitl_dir / "answers.json")
+                logger.info("See questions at %s", hitl_dir / "questions.json")
                 return EXIT_HITL
 
     # Load inputs from run directory
@@ -1893,7 +2416,7 @@ async def _run_orchestrator_inner(
         allow_scripts=False,
     )
     if not loaded_goal or not loaded_goal.goal_text.strip():
-        logger.error(f"No goal defined in {run_dir / 'goal.yaml'} (or legacy goal.md)")
+        logger.error("No goal defined in %s (or legacy goal.md)", run_dir / "goal.yaml")
         return EXIT_ERROR
 
     goal = loaded_goal.goal_text
@@ -1917,7 +2440,7 @@ async def _run_orchestrator_inner(
         agents[name] = Agent(
             name=name,
             kind=acfg["kind"],
-            cmd=acfg["cmd"],
+            cmd=resolve_agent_cmd(acfg["cmd"]),
             timeout=acfg.get("timeout", DEFAULT_TIMEOUT_SECONDS),
             suppress_stderr=acfg.get("suppress_stderr", False),
         )
@@ -1930,14 +2453,17 @@ async def _run_orchestrator_inner(
     # Validate order against agents
     for agent_name in order:
         if agent_name not in agents:
-            logger.error(f"Agent '{agent_name}' in order but not defined in agents")
+            logger.error("Agent '%s' in order but not defined in agents", agent_name)
             return EXIT_ERROR
 
     # Check for genflow config BEFORE multi-phase pattern
     if hasattr(args, 'genflow_config') and args.genflow_config:
+        from genflow_config import load_genflow_config
+        from genflow import run_genflow_orchestrator
+
         try:
             genflow_cfg = load_genflow_config(args.genflow_config)
-            logger.info(f"Loaded genflow config: {args.genflow_config}")
+            logger.info("Loaded genflow config: %s", args.genflow_config)
             logger.info("Using genflow workflow orchestrator")
             return await run_genflow_orchestrator(
                 args=args,
@@ -1949,10 +2475,10 @@ async def _run_orchestrator_inner(
                 global_dir=global_dir,
             )
         except FileNotFoundError:
-            logger.error(f"Genflow config not found: {args.genflow_config}")
+            logger.error("Genflow config not found: %s", args.genflow_config)
             return EXIT_ERROR
         except Exception as e:
-            logger.error(f"Failed to load genflow config: {e}")
+            logger.error("Failed to load genflow config: %s", e)
             return EXIT_ERROR
 
     # Check for multi-phase pattern (reliable generation)
@@ -1966,14 +2492,16 @@ async def _run_orchestrator_inner(
     # Load genloop config if specified
     genloop_cfg: Optional[GenloopConfig] = None
     if hasattr(args, 'genloop_config') and args.genloop_config:
+        from genloop_config import load_genloop_config
+
         try:
             genloop_cfg = load_genloop_config(args.genloop_config)
-            logger.info(f"Loaded genloop config: {args.genloop_config}")
+            logger.info("Loaded genloop config: %s", args.genloop_config)
         except FileNotFoundError:
-            logger.error(f"Genloop config not found: {args.genloop_config}")
+            logger.error("Genloop config not found: %s", args.genloop_config)
             return EXIT_ERROR
         except Exception as e:
-            logger.error(f"Failed to load genloop config: {e}")
+            logger.error("Failed to load genloop config: %s", e)
             return EXIT_ERROR
 
     if pattern == "multi-phase" or phases_config:
@@ -1986,6 +2514,7 @@ async def _run_orchestrator_inner(
             run_dir=run_dir,
             agents=agents,
             phases_config=phases_config or {},
+            thread_log=thread_log,
             genloop_cfg=genloop_cfg,
         )
 
@@ -1993,13 +2522,16 @@ async def _run_orchestrator_inner(
     personas_cfg = cfg.get("personas", {})
     routing_enabled = cfg.get("routing", False)
 
-    if routing_enabled and not ROUTER_AVAILABLE:
-        # FAIL LOUDLY: routing was requested but router module couldn't be imported
-        error_msg = f"Routing enabled but router module failed to import: {ROUTER_IMPORT_ERROR}"
-        logger.error(error_msg)
-        write_live(f"ERROR: {error_msg}")
-        write_live(f"Router should be at: {SCRIPT_DIR / 'router.py'}")
-        return EXIT_ERROR
+    if routing_enabled:
+        try:
+            from router import select_experts, load_experts, save_routing_result
+        except ImportError as e:
+            # FAIL LOUDLY: routing was requested but router module couldn't be imported
+            error_msg = f"Routing enabled but router module failed to import: {e}"
+            logger.error(error_msg)
+            write_live(f"ERROR: {error_msg}")
+            write_live(f"Router should be at: {SCRIPT_DIR / 'router.py'}")
+            return EXIT_ERROR
 
     # Expert assignment configuration
     expert_assignment = cfg.get("expert_assignment", None)  # None, "single_agent", or "matrix"
@@ -2010,7 +2542,7 @@ async def _run_orchestrator_inner(
     # Only populated when expert_assignment is configured
     multi_expert_tasks: List[Tuple[str, str, str]] = []
 
-    if routing_enabled and ROUTER_AVAILABLE:
+    if routing_enabled:
         logger.info("Dynamic routing enabled - selecting experts for goal...")
         write_live("=" * 40)
         write_live("ROUTING: Selecting experts for goal...")
@@ -2048,7 +2580,7 @@ async def _run_orchestrator_inner(
         save_routing_result(routing_result, run_dir)
 
         selected_experts = routing_result.selected
-        logger.info(f"Router selected: {selected_experts} (confidence: {routing_result.confidence})")
+        logger.info("Router selected: %s (confidence: %s)", selected_experts, routing_result.confidence)
         write_live(f"Selected experts ({len(selected_experts)}): {', '.join(selected_experts)}")
         write_live(f"Confidence: {routing_result.confidence}")
         write_live(f"Reasoning: {routing_result.reasoning[:200]}...")
@@ -2114,7 +2646,9 @@ async def _run_orchestrator_inner(
             return EXIT_ERROR
 
         # Load personas per agent (checks local first, then global)
-        # Note: personas_cfg was populated by routing above if enabled
+        # Note: personas_cfg was populated by routing above if enabled.
+        # Profiles often give several agents the same persona; read each once.
+        persona_bodies: Dict[str, str] = {}
         for agent_name in order:
             persona_name = personas_cfg.get(agent_name)
             if not persona_name:
@@ -2123,9 +2657,12 @@ async def _run_orchestrator_inner(
                 logger.error(error_msg)
                 write_live(f"ERROR: {error_msg}")
                 return EXIT_ERROR
+            if persona_name in persona_bodies:
+                agent_personas[agent_name] = persona_bodies[persona_name]
+                continue
             try:
                 _, persona_body = load_persona(state_dir, persona_name, global_dir)
-                agent_personas[agent_name] = persona_body
+                agent_personas[agent_name] = persona_bodies[persona_name] = persona_body
             except ValueError as e:
                 # Enhanced error: include where we looked for the persona
                 error_msg = f"Persona '{persona_name}' not found for agent '{agent_name}'"
@@ -2151,6 +2688,86 @@ async def _run_orchestrator_inner(
     max_turns = start_turn + args.turns
     cycle_length = len(order)
 
+    # Sequential pattern: run each full cycle's agents at once (opt-in; agents
+    # then see the thread as of the start of the cycle, not each other's turns)
+    parallel_cycles = cfg.get("sequential_parallel_within_cycle", False)
+    cycle_runs: Deque[Tuple[str, Optional[Tuple[Envelope, str, str]]]] = deque()
+
+    # Parallel pattern: stop a turn's other agents once one needs a human (opt-in;
+    # by default every agent finishes and all questions go into one HITL round)
+    hitl_cancels_peers = cfg.get("parallel_hitl_cancels_peers", False)
+
+    # Sequential done tracking: kept as a set, mirrored to state when it changes
+    done_agents: Set[str] = set(state.get("done_agents", []))
+    order_set = frozenset(order)
+
+    # Recent thread for prompts and the stagnation check: read from disk once,
+    # then kept current by record()
+    recent_entries = tail_thread(thread_path, n=max(20, cycle_length * 3))
+    thread_tail = ThreadTailCache(recent_entries)
+    stagnation_window: Deque[ThreadEntry] = deque(recent_entries, maxlen=cycle_length * 3)
+
+    def record(entry: Dict[str, Any]) -> None:
+        """Append an entry to the thread log and the in-memory thread tails."""
+        thread_log.append(entry)
+        thread_entry = ThreadEntry.from_dict(entry)
+        thread_tail.append(thread_entry)
+        stagnation_window.append(thread_entry)
+
+    def record_agent_turn(turn: int, agent_name: str, env: Envelope) -> None:
+        """Save a sequential turn's envelope and append its thread entry."""
+        turn_dir = run_dir / "turns" / f"turn_{turn + 1:04d}"
+        # Validate artifacts (relative to project, not run_dir)
+        warnings = save_envelope(turn_dir / f"out_{agent_name}.json", env)
+        if warnings:
+            env.message += f"\n[Warnings: {'; '.join(warnings)}]"
+
+        record(
+            {
+                **thread_event_header(f"{agent_name}:{turn}"),
+                "turn": turn + 1,
+                "agent": agent_name,
+                "role": "assistant",
+                "status": env.status,
+                "content": env.message,
+                "questions": env.questions,
+                "artifacts": env.artifacts,
+                "confidence": env.confidence,
+            },
+        )
+
+    def record_queued_cycle_runs(turn: int) -> None:
+        """Record parallel-cycle results still queued when the run ends at turn.
+
+        Those agents already ran, so their turns are saved like any other, and
+        the state's turn moves to the last one so a continued run doesn't redo
+        them.
+        """
+        for later_turn in range(turn + 1, turn + 1 + len(cycle_runs)):
+            agent_name = order[later_turn % cycle_length]
+            prompt, run_result = cycle_runs.popleft()
+            if run_result is None:  # Cancelled once another agent needed a human
+                write_live(f">>> {agent_name} cancelled: another agent needs human input")
+                continue
+            env = run_result[0]
+            turn_dir = run_dir / "turns" / f"turn_{later_turn + 1:04d}"
+            write_text_fast(turn_dir / f"prompt_{agent_name}.txt", prompt)
+            write_live(f">>> {agent_name} finished (turn {later_turn + 1}): status={env.status}")
+            record_agent_turn(later_turn, agent_name, env)
+            state["turn"] = later_turn
+
+    def discard_queued_cycle_runs(turn: int) -> None:
+        """Drop parallel-cycle results queued after a HITL stop at turn.
+
+        A resumed run starts again from the HITL turn, so the later agents run
+        their turns then, with the human's answers in the thread.
+        """
+        for later_turn in range(turn + 1, turn + 1 + len(cycle_runs)):
+            agent_name = order[later_turn % cycle_length]
+            _, run_result = cycle_runs.popleft()
+            outcome = "cancelled" if run_result is None else "result discarded"
+            write_live(f">>> {agent_name} {outcome} (turn {later_turn + 1}): reruns after human input")
+
     # Multi-expert execution path: runs all expert tasks in parallel (single round)
     if multi_expert_tasks:
         write_live("=" * 40)
@@ -2160,7 +2777,19 @@ async def _run_orchestrator_inner(
         turn_dir = run_dir / "turns" / "turn_0001"
         turn_dir.mkdir(parents=True, exist_ok=True)
 
-        thread_tail = tail_thread(thread_path)
+        # Optional cap on concurrently running experts (0 = no limit)
+        max_concurrent = cfg.get("max_concurrent_experts", 0)
+        expert_slots = asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else contextlib.nullcontext()
+
+        async def run_expert(
+            idx: int, agent: Agent, prompt: str, stderr_path: Path
+        ) -> Tuple[int, Tuple[Envelope, str, str]]:
+            """Run one expert, waiting for a free slot when concurrency is capped."""
+            async with expert_slots:
+                return idx, await run_agent(
+                    agent, prompt, stream=not args.no_stream, stderr_path=stderr_path
+                )
+
         tasks = []
         task_info: List[Tuple[str, str]] = []  # [(agent_name, persona_name), ...]
 
@@ -2181,37 +2810,34 @@ async def _run_orchestrator_inner(
                 hitl_answers=None,
                 enable_research=enable_research,
             )
-            write_text_atomic(turn_dir / f"prompt_{agent_name}_{persona_name}.txt", prompt)
-            tasks.append(run_agent(agent, prompt, stream=not args.no_stream))
+            write_text_fast(turn_dir / f"prompt_{agent_name}_{persona_name}.txt", prompt)
+            tasks.append(run_expert(
+                len(tasks), agent, prompt, turn_dir / f"stderr_{agent_name}_{persona_name}.log"
+            ))
             task_info.append((agent_name, persona_name))
 
         write_live(f"Running {len(tasks)} parallel expert reviews...")
         for agent_name, persona_name in task_info:
             write_live(f"  • {persona_name} ({agent_name})")
 
-        results = await asyncio.gather(*tasks)
-
-        # Collect results
-        all_messages = []
-        hitl_questions: List[Dict[str, Any]] = []
+        # Handle each review as it finishes instead of waiting for the slowest;
+        # the summary and HITL questions are still assembled in task order
+        all_messages: List[str] = [""] * len(tasks)
+        expert_questions: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        batch_ts = utc_now_iso()  # One timestamp for all of this round's entries
 
-        for (env, raw_out, raw_err), (agent_name, persona_name) in zip(results, task_info):
+        for finished in asyncio.as_completed(tasks):
+            idx, (env, raw_out, raw_err) = await finished
+            agent_name, persona_name = task_info[idx]
             task_id = f"{agent_name}_{persona_name}"
             write_live(f">>> {persona_name} ({agent_name}): status={env.status}")
-            all_messages.append(f"**{persona_name}** ({agent_name}): {env.message}")
+            all_messages[idx] = f"**{persona_name}** ({agent_name}): {env.message}"
 
-            write_text_atomic(
-                turn_dir / f"out_{task_id}.json",
-                json.dumps(env.to_dict(), indent=2),
-            )
-            if raw_err:
-                write_text_atomic(turn_dir / f"stderr_{task_id}.log", raw_err)
+            write_bytes_fast(turn_dir / f"out_{task_id}.json", json_dumps_pretty(env.to_dict()))
 
-            append_jsonl_durable(
-                thread_path,
+            record(
                 {
-                    "id": sha256(f"{task_id}:{utc_now_iso()}:1"),
-                    "ts": utc_now_iso(),
+                    **thread_event_header(f"{task_id}:1", batch_ts),
                     "turn": 1,
                     "agent": agent_name,
                     "persona": persona_name,
@@ -2219,22 +2845,24 @@ async def _run_orchestrator_inner(
                     "status": env.status,
                     "content": env.message,
                     "questions": env.questions,
-                    "artifacts": [a for a in env.artifacts],
+                    "artifacts": env.artifacts,
                     "confidence": env.confidence,
                     "agrees_with": env.agrees_with,
                 },
             )
 
             if env.status == "needs_human" and env.questions:
-                hitl_questions.append(
-                    {"agent": agent_name, "persona": persona_name, "questions": env.questions}
-                )
+                expert_questions[idx] = {
+                    "agent": agent_name, "persona": persona_name, "questions": env.questions
+                }
 
         # Check for HITL
+        hitl_questions = [q for q in expert_questions if q is not None]
         if hitl_questions:
+            thread_log.flush()
             write_hitl_questions(run_dir, hitl_questions, 1)
             state["awaiting_human"] = True
-            save_json_atomic(state_path, state)
+            journal.checkpoint()
             write_live(f"\nHITL: {len(hitl_questions)} experts need human input")
             write_agent_result(run_dir, "needs_human", EXIT_HITL, questions=hitl_questions)
             return EXIT_HITL
@@ -2246,23 +2874,49 @@ async def _run_orchestrator_inner(
         write_text_atomic(final_dir / "expert_reviews.md", combined_summary)
 
         write_live("=" * 40)
-        write_live(f"Multi-expert review complete: {len(results)} reviews collected")
+        write_live(f"Multi-expert review complete: {len(tasks)} reviews collected")
         write_live(f"Output: {final_dir / 'expert_reviews.md'}")
         write_live("=" * 40)
 
-        write_resolution(run_dir, "multi_expert_complete", 1, f"Completed {len(results)} expert reviews")
-        write_agent_result(run_dir, "done", EXIT_OK, summary=f"Multi-expert review complete ({len(results)} reviews)")
+        write_resolution(run_dir, "multi_expert_complete", 1, f"Completed {len(tasks)} expert reviews")
+        write_agent_result(run_dir, "done", EXIT_OK, summary=f"Multi-expert review complete ({len(tasks)} reviews)")
         return EXIT_OK
 
+    # Prompt inputs that stay fixed for the whole run, per agent; each turn
+    # only supplies its index and any pending HITL answers
+    prompt_inputs: Dict[str, Dict[str, Any]] = {
+        agent_name: {
+            "agent_name": agent_name,
+            "mode": mode_name,
+            "mode_body": mode_body,
+            "persona_body": agent_personas.get(agent_name, ""),
+            "pattern": pattern,
+            "max_turns": max_turns,
+            "goal": goal,
+            "context": context,
+            "summary": summary,
+            "thread_tail": thread_tail,
+            "enable_research": enable_research,
+        }
+        for agent_name in order
+    }
+
+    # The per-turn counters below only reach state.json.log, so write a full
+    # snapshot first; status checks then always find a state.json to read
+    journal.checkpoint()
+
     for turn in range(start_turn, max_turns):
-        state["turn"] = turn
-        save_json_atomic(state_path, state)
+        # Last turn's thread entries hit disk before the turn counter moves on
+        thread_log.flush()
+        journal.update({
+            "turn": turn,
+            "done_agents": state.get("done_agents", []),
+            "done_cycle": state.get("done_cycle", -1),
+        })
 
         turn_dir = run_dir / "turns" / f"turn_{turn + 1:04d}"
         turn_dir.mkdir(parents=True, exist_ok=True)
 
-        thread_tail = tail_thread(thread_path)
-
         # Calculate current cycle for done tracking
         current_cycle = turn // cycle_length
 
@@ -2271,33 +2925,60 @@ async def _run_orchestrator_inner(
             agent_name = order[turn % cycle_length]
             agent = agents[agent_name]
 
-            prompt = build_prompt(
-                agent_name=agent_name,
-                mode=mode_name,
-                mode_body=mode_body,
-                persona_body=agent_personas.get(agent_name, ""),
-                pattern=pattern,
-                turn_idx=turn + 1,
-                max_turns=max_turns,
-                goal=goal,
-                context=context,
-                summary=summary,
-                thread_tail=thread_tail,
-                hitl_answers=hitl_answers,
-                enable_research=enable_research,
-            )
-            hitl_answers = None  # Clear after first use
+            if parallel_cycles and turn % cycle_length == 0 and turn + cycle_length <= max_turns:
+                cycle_prompts = [
+                    build_prompt(
+                        **prompt_inputs[name],
+                        turn_idx=turn + i + 1,
+                        hitl_answers=hitl_answers if i == 0 else None,
+                    )
+                    for i, name in enumerate(order)
+                ]
+                hitl_answers = None
+
+                logger.info("Turns %s-%s: Running cycle in parallel...", turn + 1, turn + cycle_length)
+                write_live(f"CYCLE {current_cycle + 1}: PARALLEL ({', '.join(order)})")
+                cycle_tasks = [
+                    asyncio.ensure_future(run_agent(
+                        agents[name], cycle_prompt, stream=not args.no_stream,
+                        stderr_path=run_dir / "turns" / f"turn_{turn + i + 1:04d}" / f"stderr_{name}.log",
+                    ))
+                    for i, (name, cycle_prompt) in enumerate(zip(order, cycle_prompts))
+                ]
+                if hitl_cancels_peers:
+                    cycle_results = await gather_until_hitl(cycle_tasks)
+                else:
+                    cycle_results = await asyncio.gather(*cycle_tasks)
+                # Each result is then handled as its own turn, in order; a
+                # cancelled agent (None) runs on its turn as usual
+                cycle_runs.extend(zip(cycle_prompts, cycle_results))
+
+            if cycle_runs:
+                prompt, run_result = cycle_runs.popleft()
+                if run_result is None and turn % cycle_length:
+                    # Cancelled, so it runs now; earlier turns of the cycle
+                    # have been recorded since its prompt was built
+                    prompt = build_prompt(**prompt_inputs[agent_name], turn_idx=turn + 1)
+            else:
+                prompt = build_prompt(
+                    **prompt_inputs[agent_name], turn_idx=turn + 1, hitl_answers=hitl_answers
+                )
+                hitl_answers = None  # Clear after first use
+                run_result = None
 
-            write_text_atomic(turn_dir / f"prompt_{agent_name}.txt", prompt)
+            write_text_fast(turn_dir / f"prompt_{agent_name}.txt", prompt)
 
-            logger.info(f"Turn {turn + 1}: Running {agent_name}...")
+            logger.info("Turn %s: Running %s...", turn + 1, agent_name)
             write_live("-" * 40)
             write_live(f"TURN {turn + 1}: {agent_name}")
             write_live("-" * 40)
 
-            env, raw_out, raw_err = await run_agent(
-                agent, prompt, stream=not args.no_stream
-            )
+            if run_result is None:
+                run_result = await run_agent(
+                    agent, prompt, stream=not args.no_stream,
+                    stderr_path=turn_dir / f"stderr_{agent_name}.log",
+                )
+            env, raw_out, raw_err = run_result
 
             write_live(f">>> {agent_name} finished: status={env.status}")
 
@@ -2311,44 +2992,20 @@ async def _run_orchestrator_inner(
                         q_text = str(q)
                     write_live(f"  - {q_text}")
 
-            write_text_atomic(
-                turn_dir / f"out_{agent_name}.json", json.dumps(env.to_dict(), indent=2)
-            )
-            if raw_err:
-                write_text_atomic(turn_dir / f"stderr_{agent_name}.log", raw_err)
-
-            # Validate artifacts (relative to project, not run_dir)
-            warnings = validate_artifacts(env, Path.cwd())
-            if warnings:
-                env.message += f"\n[Warnings: {'; '.join(warnings)}]"
-
-            # Append to thread
-            append_jsonl_durable(
-                thread_path,
-                {
-                    "id": sha256(f"{agent_name}:{utc_now_iso()}:{turn}"),
-                    "ts": utc_now_iso(),
-                    "turn": turn + 1,
-                    "agent": agent_name,
-                    "role": "assistant",
-                    "status": env.status,
-                    "content": env.message,
-                    "questions": env.questions,
-                    "artifacts": [a for a in env.artifacts],
-                    "confidence": env.confidence,
-                },
-            )
+            record_agent_turn(turn, agent_name, env)
 
             # Handle HITL
             if env.status == "needs_human" and env.questions:
+                discard_queued_cycle_runs(turn)
+                thread_log.flush()
                 write_hitl_questions(
                     run_dir,
                     [{"agent": agent_name, "questions": env.questions}],
                     turn + 1,
                 )
                 state["awaiting_human"] = True
-                save_json_atomic(state_path, state)
-                logger.info(f"HITL requested by {agent_name}")
+                journal.checkpoint()
+                logger.info("HITL requested by %s", agent_name)
                 write_agent_result(
                     run_dir, "needs_human", EXIT_HITL,
                     questions=[{"agent": agent_name, "questions": env.questions}]
@@ -2357,7 +3014,7 @@ async def _run_orchestrator_inner(
 
             # Handle research requests
             if env.status == "needs_research" and env.research_topics and enable_research:
-                logger.info(f"Research requested by {agent_name}: {env.research_topics}")
+                logger.info("Research requested by %s: %s", agent_name, env.research_topics)
                 research_results = await run_research(
                     topics=env.research_topics,
                     research_agent_cmd=research_agent_cmd,
@@ -2365,11 +3022,9 @@ async def _run_orchestrator_inner(
                     stream=not args.no_stream,
                 )
                 # Append research results to thread
-                append_jsonl_durable(
-                    thread_path,
+                record(
                     {
-                        "id": sha256(f"researcher:{utc_now_iso()}:{turn}"),
-                        "ts": utc_now_iso(),
+                        **thread_event_header(f"researcher:{turn}"),
                         "turn": turn + 1,
                         "agent": "researcher",
                         "role": "system",
@@ -2384,16 +3039,18 @@ async def _run_orchestrator_inner(
             # Track done status per-cycle (not per-turn)
             if state.get("done_cycle") != current_cycle:
                 # New cycle: reset done tracking
+                done_agents.clear()
                 state["done_agents"] = []
                 state["done_cycle"] = current_cycle
 
             if env.status == "done":
-                done_agents = set(state.get("done_agents", []))
                 done_agents.add(agent_name)
                 state["done_agents"] = list(done_agents)
 
                 # Check if all agents have said done in this cycle
-                if done_agents >= set(order):
+                if done_agents >= order_set:
+                    record_queued_cycle_runs(turn)
+                    journal.checkpoint()
                     write_resolution(run_dir, "all_done", turn + 1, env.message)
                     logger.info("All agents reported done. Stopping.")
                     write_agent_result(
@@ -2404,43 +3061,49 @@ async def _run_orchestrator_inner(
 
         else:  # parallel
             # Parallel: all agents run concurrently
+            logger.info("Turn %s: Running all agents in parallel...", turn + 1)
+            write_live("-" * 40)
+            write_live(f"TURN {turn + 1}: PARALLEL ({', '.join(order)})")
+            write_live("-" * 40)
+
             tasks = []
             prompts: Dict[str, str] = {}
 
             for agent_name in order:
                 agent = agents[agent_name]
                 prompt = build_prompt(
-                    agent_name=agent_name,
-                    mode=mode_name,
-                    mode_body=mode_body,
-                    persona_body=agent_personas.get(agent_name, ""),
-                    pattern=pattern,
-                    turn_idx=turn + 1,
-                    max_turns=max_turns,
-                    goal=goal,
-                    context=context,
-                    summary=summary,
-                    thread_tail=thread_tail,
-                    hitl_answers=hitl_answers,
-                    enable_research=enable_research,
+                    **prompt_inputs[agent_name], turn_idx=turn + 1, hitl_answers=hitl_answers
                 )
                 prompts[agent_name] = prompt
-                write_text_atomic(turn_dir / f"prompt_{agent_name}.txt", prompt)
-                tasks.append(run_agent(agent, prompt, stream=not args.no_stream))
+                tasks.append(asyncio.ensure_future(run_agent(
+                    agent, prompt, stream=not args.no_stream,
+                    stderr_path=turn_dir / f"stderr_{agent_name}.log",
+                )))
+                # Let the agent's process spawn before the next prompt is built
+                await asyncio.sleep(0)
+                write_text_fast(turn_dir / f"prompt_{agent_name}.txt", prompt)
 
             hitl_answers = None
 
-            logger.info(f"Turn {turn + 1}: Running all agents in parallel...")
-            write_live("-" * 40)
-            write_live(f"TURN {turn + 1}: PARALLEL ({', '.join(order)})")
-            write_live("-" * 40)
+            if hitl_cancels_peers:
+                results = await gather_until_hitl(tasks)
+            else:
+                results = await asyncio.gather(*tasks)
+            batch_ts = utc_now_iso()  # One timestamp for all of this turn's entries
+
+            # Agents cancelled because another one needed a human have no result
+            finished = [(name, result) for name, result in zip(order, results) if result is not None]
 
-            results = await asyncio.gather(*tasks)
+            # Save envelopes and check artifacts for all agents at once, off the loop
+            all_warnings = await asyncio.gather(*(
+                asyncio.to_thread(save_envelope, turn_dir / f"out_{agent_name}.json", env)
+                for agent_name, (env, raw_out, raw_err) in finished
+            ))
 
             envelopes: Dict[str, Envelope] = {}
             hitl_questions: List[Dict[str, Any]] = []
 
-            for agent_name, (env, raw_out, raw_err) in zip(order, results):
+            for (agent_name, (env, raw_out, raw_err)), warnings in zip(finished, all_warnings):
                 write_live(f">>> {agent_name} finished: status={env.status}")
                 envelopes[agent_name] = env
 
@@ -2454,30 +3117,19 @@ async def _run_orchestrator_inner(
                             q_text = str(q)
                         write_live(f"  - {q_text}")
 
-                write_text_atomic(
-                    turn_dir / f"out_{agent_name}.json",
-                    json.dumps(env.to_dict(), indent=2),
-                )
-                if raw_err:
-                    write_text_atomic(turn_dir / f"stderr_{agent_name}.log", raw_err)
-
-                # Validate artifacts (relative to project)
-                warnings = validate_artifacts(env, Path.cwd())
                 if warnings:
                     env.message += f"\n[Warnings: {'; '.join(warnings)}]"
 
-                append_jsonl_durable(
-                    thread_path,
+                record(
                     {
-                        "id": sha256(f"{agent_name}:{utc_now_iso()}:{turn}"),
-                        "ts": utc_now_iso(),
+                        **thread_event_header(f"{agent_name}:{turn}", batch_ts),
                         "turn": turn + 1,
                         "agent": agent_name,
                         "role": "assistant",
                         "status": env.status,
                         "content": env.message,
                         "questions": env.questions,
-                        "artifacts": [a for a in env.artifacts],
+                        "artifacts": env.artifacts,
                         "confidence": env.confidence,
                         "agrees_with": env.agrees_with,
                     },
@@ -2488,12 +3140,17 @@ async def _run_orchestrator_inner(
                         {"agent": agent_name, "questions": env.questions}
                     )
 
+            for agent_name, result in zip(order, results):
+                if result is None:
+                    write_live(f">>> {agent_name} cancelled: another agent needs human input")
+
             # Handle HITL (collected from all agents)
             if hitl_questions:
+                thread_log.flush()
                 write_hitl_questions(run_dir, hitl_questions, turn + 1)
                 state["awaiting_human"] = True
-                save_json_atomic(state_path, state)
-                logger.info(f"HITL requested by {len(hitl_questions)} agent(s)")
+                journal.checkpoint()
+                logger.info("HITL requested by %s agent(s)", len(hitl_questions))
                 write_agent_result(
                     run_dir, "needs_human", EXIT_HITL,
                     questions=hitl_questions
@@ -2502,6 +3159,7 @@ async def _run_orchestrator_inner(
 
             # Check consensus
             if args.stop_on_consensus and check_consensus(envelopes):
+                journal.checkpoint()
                 write_resolution(
                     run_dir, "consensus", turn + 1, "Agents reached consensus"
                 )
@@ -2514,6 +3172,7 @@ async def _run_orchestrator_inner(
 
             # Check if all done
             if all(e.status == "done" for e in envelopes.values()):
+                journal.checkpoint()
                 write_resolution(
                     run_dir, "all_done", turn + 1, "All agents reported done"
                 )
@@ -2528,11 +3187,9 @@ async def _run_orchestrator_inner(
             summary_lines = [
                 f"- {a}: {e.status} (conf={e.confidence})" for a, e in envelopes.items()
             ]
-            append_jsonl_durable(
-                thread_path,
+            record(
                 {
-                    "id": sha256(f"moderator:{utc_now_iso()}:{turn}"),
-                    "ts": utc_now_iso(),
+                    **thread_event_header(f"moderator:{turn}", batch_ts),
                     "turn": turn + 1,
                     "agent": "moderator",
                     "role": "system",
@@ -2543,8 +3200,9 @@ async def _run_orchestrator_inner(
 
         # Check stagnation (after turn 2+)
         if turn >= 2 and args.stop_on_stagnation:
-            thread_tail = tail_thread(thread_path, n=cycle_length * 3)
-            if detect_stagnation(thread_tail, order):
+            if detect_stagnation(list(stagnation_window), order):
+                record_queued_cycle_runs(turn)
+                journal.checkpoint()
                 write_resolution(
                     run_dir, "stagnation", turn + 1, "No significant progress detected"
                 )
@@ -2556,8 +3214,9 @@ async def _run_orchestrator_inner(
                 return EXIT_OK
 
     # Max turns reached
+    journal.checkpoint()
     write_resolution(run_dir, "max_turns", max_turns, "Reached maximum turn limit")
-    logger.info(f"Reached max turns ({max_turns}).")
+    logger.info("Reached max turns (%s).", max_turns)
     write_agent_result(
         run_dir, "done", EXIT_MAX_TURNS,
         summary="Reached maximum turn limit"
@@ -2565,6 +3224,53 @@ async def _run_orchestrator_inner(
     return EXIT_MAX_TURNS
 
 
+async def gather_until_hitl(
+    tasks: List["asyncio.Future[Tuple[Envelope, str, str]]"],
+) -> List[Optional[Tuple[Envelope, str, str]]]:
+    """Like asyncio.gather over run_agent tasks, but stops at the first HITL request.
+
+    Once a finished agent is needs_human with questions, the tasks still
+    running are cancelled (which kills their processes) and come back as None.
+    """
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if any(t.result()[0].status == "needs_human" and t.result()[0].questions for t in done):
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            break
+    return [None if t.cancelled() else t.result() for t in tasks]
+
+
+def save_envelope(path: Path, env: Envelope) -> List[str]:
+    """Save an agent's envelope to path and return its artifact warnings.
+
+    Blocking file I/O, so parallel turns run it for each agent in a worker thread.
+    """
+    write_bytes_fast(path, json_dumps_pretty(env.to_dict()))
+    return validate_artifacts(env, Path.cwd())
+
+
+def run_event_loop(main: Coroutine[Any, Any, int]) -> int:
+    """Run the orchestrator's event loop, on uvloop when it is installed.
+
+    uvloop comes in through asyncio.Runner's loop factory rather than a
+    process-wide event loop policy, so Python 3.10 keeps the default loop.
+    """
+    loop_factory = None
+    if sys.version_info >= (3, 11):
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            pass
+    if loop_factory is None:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Agent Arena Orchestrator")
     ap.add_argument("--config", default="arena.config.json", help="Config file path")
@@ -2634,7 +3340,7 @@ def main() -> int:
             print("\nExpected location: arena-plugin/templates/reliable-generation/README.md")
         return EXIT_OK
 
-    return asyncio.run(run_orchestrator(args))
+    return run_event_loop(run_orchestrator(args))
 
 
 if __name__ == "__main__":
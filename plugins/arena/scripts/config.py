@@ -10,9 +10,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
-from utils import read_text, load_json, validate_name, write_text_atomic
+from utils import read_text, load_json, load_yaml, list_yaml_files, validate_name, write_text_atomic
 from models import Constraint
 
 logger = logging.getLogger("arena")
@@ -24,7 +22,7 @@ def load_constraints(constraints_dir: Path) -> List[Constraint]:
     if not constraints_dir.exists():
         return constraints
 
-    for yaml_file in constraints_dir.glob("*.yaml"):
+    for yaml_file in list_yaml_files(constraints_dir):
         try:
             constraint = Constraint.from_yaml(yaml_file)
             constraints.append(constraint)
@@ -75,7 +73,7 @@ def load_frontmatter_doc(path: Path) -> Tuple[Dict[str, Any], str]:
         return {}, content
 
     try:
-        frontmatter = yaml.safe_load(parts[1]) or {}
+        frontmatter = load_yaml(parts[1]) or {}
         body = parts[2].strip()
         return frontmatter, body
     except Exception as e:
@@ -11,16 +11,16 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 import logging
-import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from models import Agent, Constraint, Critique, CritiqueIssue, Adjudication
 from parsers import parse_critique, parse_adjudication
 from utils import (
-    write_live, utc_now_iso, sha256,
-    append_jsonl_durable, save_json_atomic, load_json,
-    write_text_atomic, ensure_secure_dir,
+    write_live, utc_now_iso, thread_event_header, count_words,
+    append_jsonl_durable, JsonlBatcher, save_json_atomic, load_json,
+    write_text_atomic, write_text_fast, write_bytes_fast,
+    copy_file_contents, ensure_secure_dir,
 )
 from hitl import write_hitl_questions, write_agent_result, write_resolution
 from config import load_constraints, compress_constraints, save_compressed_constraints
@@ -87,7 +87,7 @@ class CritiqueStepResult:
 
 async def run_process(
     cmd: List[str],
-    stdin_text: str,
+    stdin_data: Union[str, bytes],
     timeout: Optional[int],
     stream_prefix: Optional[str] = None,
     suppress_stderr: bool = False,
@@ -95,7 +95,7 @@ async def run_process(
     """Run subprocess with optional timeout and streaming output."""
     # Import here to avoid circular imports
     from arena import run_process as arena_run_process
-    return await arena_run_process(cmd, stdin_text, timeout, stream_prefix, suppress_stderr)
+    return await arena_run_process(cmd, stdin_data, timeout, stream_prefix, suppress_stderr)
 
 
 def build_generator_prompt(
@@ -227,8 +227,7 @@ async def run_genflow_orchestrator(
                 append_jsonl_durable(
                     thread_path,
                     {
-                        "id": sha256(f"human:{utc_now_iso()}"),
-                        "ts": utc_now_iso(),
+                        **thread_event_header("human"),
                         "iteration": state.get("iteration", 1),
                         "phase": "hitl_response",
                         "agent": "human",
@@ -493,7 +492,7 @@ async def execute_generate_step(step: WorkflowStep, context: WorkflowContext) ->
     )
 
     # Save prompt
-    write_text_atomic(iter_dir / f"prompt_generate_{agent_name}.txt", prompt)
+    write_text_fast(iter_dir / f"prompt_generate_{agent_name}.txt", prompt)
 
     # Run generator
     stream_prefix = agent_name if not context.no_stream else None
@@ -509,14 +508,13 @@ async def execute_generate_step(step: WorkflowStep, context: WorkflowContext) ->
     context.artifact_path = iter_dir / "artifact.md"
     write_text_atomic(context.artifact_path, context.artifact)
 
-    write_live(f"  ✓ Generated artifact (~{len(context.artifact.split())} words)")
+    write_live(f"  ✓ Generated artifact (~{count_words(context.artifact.encode('utf-8'))} words)")
 
     # Append to thread
     append_jsonl_durable(
         context.thread_path,
         {
-            "id": sha256(f"generate:{utc_now_iso()}:{context.iteration}"),
-            "ts": utc_now_iso(),
+            **thread_event_header(f"generate:{context.iteration}"),
             "iteration": context.iteration,
             "phase": "generate",
             "step_name": step.name,
@@ -589,95 +587,95 @@ async def execute_critique_serial(step: WorkflowStep, context: WorkflowContext)
     halted = False
     halt_reason = None
 
-    for constraint in constraints:
-        if halted:
-            break
-
-        # Get agent for this constraint
-        agent_name = step.agent or "claude"
-        if agent_name not in context.agents:
-            logger.warning(f"Agent '{agent_name}' not found, skipping {constraint.id}")
-            continue
-        agent = context.agents[agent_name]
-        agent_cmd = get_agent_cmd_with_model(agent, step.model)
-
-        write_live(f"  {agent_name} ({constraint.id}) → reviewing...")
+    # Thread entries for the whole step go out in one write+fsync
+    with JsonlBatcher(context.thread_path) as critique_log:
+        for constraint in constraints:
+            if halted:
+                break
 
-        # Build prompt
-        prompt = build_critic_prompt(
-            constraint=constraint,
-            artifact=context.artifact,
-            goal=context.goal,
-            iteration=context.iteration,
-            run_dir=context.run_dir,
-            project_root=context.project_root,
-            artifact_path=context.artifact_path,
-            allow_scripts=context.allow_scripts,
-            arena_home=context.global_dir,
-        )
+            # Get agent for this constraint
+            agent_name = step.agent or "claude"
+            if agent_name not in context.agents:
+                logger.warning(f"Agent '{agent_name}' not found, skipping {constraint.id}")
+                continue
+            agent = context.agents[agent_name]
+            agent_cmd = get_agent_cmd_with_model(agent, step.model)
+
+            write_live(f"  {agent_name} ({constraint.id}) → reviewing...")
+
+            # Build prompt
+            prompt = build_critic_prompt(
+                constraint=constraint,
+                artifact=context.artifact,
+                goal=context.goal,
+                iteration=context.iteration,
+                run_dir=context.run_dir,
+                project_root=context.project_root,
+                artifact_path=context.artifact_path,
+                allow_scripts=context.allow_scripts,
+                arena_home=context.global_dir,
+            )
 
-        write_text_atomic(critiques_dir / f"prompt_{constraint.id}_{agent_name}.txt", prompt)
+            write_text_fast(critiques_dir / f"prompt_{constraint.id}_{agent_name}.txt", prompt)
 
-        # Run critic
-        stream_prefix = f"{agent_name}[{constraint.id}]" if not context.no_stream else None
-        rc, stdout, stderr = await run_process(
-            agent_cmd, prompt, agent.timeout, stream_prefix, agent.suppress_stderr
-        )
+            # Run critic
+            stream_prefix = f"{agent_name}[{constraint.id}]" if not context.no_stream else None
+            rc, stdout, stderr = await run_process(
+                agent_cmd, prompt, agent.timeout, stream_prefix, agent.suppress_stderr
+            )
 
-        critique = parse_critique(stdout, agent_name, constraint.id, context.iteration)
-        critiques.append(critique)
+            critique = parse_critique(stdout, agent_name, constraint.id, context.iteration)
+            critiques.append(critique)
 
-        # Save critique
-        save_json_atomic(critiques_dir / f"{constraint.id}-{agent_name}.json", critique.to_dict())
+            # Save critique
+            save_json_atomic(critiques_dir / f"{constraint.id}-{agent_name}.json", critique.to_dict())
 
-        # Process issues with behavior handling
-        filtered_issues = []
-        for issue in critique.issues:
-            behavior = get_behavior_for_severity(constraint, issue.severity, context.genflow_cfg)
+            # Process issues with behavior handling
+            filtered_issues = []
+            for issue in critique.issues:
+                behavior = get_behavior_for_severity(constraint, issue.severity, context.genflow_cfg)
 
-            if behavior == IssueBehavior.HALT:
-                write_live(f"    [{issue.severity}] {issue.id}: HALT")
-                halted = True
-                halt_reason = f"{issue.severity} issue in {constraint.id}: {issue.finding[:50]}"
-                filtered_issues.append(issue)
-                break
-            elif behavior == IssueBehavior.ESCALATE:
-                write_live(f"    [{issue.severity}] {issue.id}: ESCALATE")
-                escalate_issues.append(issue)
-            elif behavior == IssueBehavior.CONTINUE:
-                write_live(f"    [{issue.severity}] {issue.id}: continue")
-                filtered_issues.append(issue)
-            else:  # IGNORE
-                write_live(f"    [{issue.severity}] {issue.id}: ignore")
-
-        # Create filtered critique
-        if filtered_issues or not critique.issues:
-            filtered_critique = Critique(
-                constraint_id=critique.constraint_id,
-                reviewer=critique.reviewer,
-                iteration=critique.iteration,
-                overall=critique.overall if filtered_issues else "PASS",
-                issues=filtered_issues,
-                approved_sections=critique.approved_sections,
-                summary=critique.summary,
+                if behavior == IssueBehavior.HALT:
+                    write_live(f"    [{issue.severity}] {issue.id}: HALT")
+                    halted = True
+                    halt_reason = f"{issue.severity} issue in {constraint.id}: {issue.finding[:50]}"
+                    filtered_issues.append(issue)
+                    break
+                elif behavior == IssueBehavior.ESCALATE:
+                    write_live(f"    [{issue.severity}] {issue.id}: ESCALATE")
+                    escalate_issues.append(issue)
+                elif behavior == IssueBehavior.CONTINUE:
+                    write_live(f"    [{issue.severity}] {issue.id}: continue")
+                    filtered_issues.append(issue)
+                else:  # IGNORE
+                    write_live(f"    [{issue.severity}] {issue.id}: ignore")
+
+            # Create filtered critique
+            if filtered_issues or not critique.issues:
+                filtered_critique = Critique(
+                    constraint_id=critique.constraint_id,
+                    reviewer=critique.reviewer,
+                    iteration=critique.iteration,
+                    overall=critique.overall if filtered_issues else "PASS",
+                    issues=filtered_issues,
+                    approved_sections=critique.approved_sections,
+                    summary=critique.summary,
+                )
+                filtered_critiques.append(filtered_critique)
+
+            # Log to thread
+            critique_log.append(
+                {
+                    **thread_event_header(f"critique:{agent_name}:{constraint.id}"),
+                    "iteration": context.iteration,
+                    "phase": "critique",
+                    "step_name": step_name,
+                    "agent": agent_name,
+                    "constraint": constraint.id,
+                    "issues_count": len(critique.issues),
+                    "overall": critique.overall,
+                },
             )
-            filtered_critiques.append(filtered_critique)
-
-        # Log to thread
-        append_jsonl_durable(
-            context.thread_path,
-            {
-                "id": sha256(f"critique:{agent_name}:{constraint.id}:{utc_now_iso()}"),
-                "ts": utc_now_iso(),
-                "iteration": context.iteration,
-                "phase": "critique",
-                "step_name": step_name,
-                "agent": agent_name,
-                "constraint": constraint.id,
-                "issues_count": len(critique.issues),
-                "overall": critique.overall,
-            },
-        )
 
     return CritiqueStepResult(
         critiques=critiques,
@@ -726,7 +724,7 @@ async def execute_critique_parallel(step: WorkflowStep, context: WorkflowContext
             arena_home=context.global_dir,
         )
 
-        write_text_atomic(critiques_dir / f"prompt_{constraint.id}_{agent_name}.txt", prompt)
+        write_text_fast(critiques_dir / f"prompt_{constraint.id}_{agent_name}.txt", prompt)
         write_live(f"  {agent_name} ({constraint.id}) → reviewing...")
 
         stream_prefix = f"{agent_name}[{constraint.id}]" if not context.no_stream else None
@@ -744,66 +742,67 @@ async def execute_critique_parallel(step: WorkflowStep, context: WorkflowContext
     halted = False
     halt_reason = None
 
-    for (rc, stdout, stderr), (agent_name, constraint) in zip(results, task_info):
-        critique = parse_critique(stdout, agent_name, constraint.id, context.iteration)
-        critiques.append(critique)
-
-        # Save critique
-        save_json_atomic(critiques_dir / f"{constraint.id}-{agent_name}.json", critique.to_dict())
-
-        # Apply behaviors post-hoc
-        filtered_issues = []
-        for issue in critique.issues:
-            behavior = get_behavior_for_severity(constraint, issue.severity, context.genflow_cfg)
-
-            if behavior == IssueBehavior.HALT:
-                if not halted:
-                    halted = True
-                    halt_reason = f"{issue.severity} issue in {constraint.id}"
-                filtered_issues.append(issue)
-            elif behavior == IssueBehavior.ESCALATE:
-                escalate_issues.append(issue)
-            elif behavior == IssueBehavior.CONTINUE:
-                filtered_issues.append(issue)
-            # IGNORE: don't add to filtered
-
-        # Create filtered critique
-        if filtered_issues or not critique.issues:
-            filtered_critique = Critique(
-                constraint_id=critique.constraint_id,
-                reviewer=critique.reviewer,
-                iteration=critique.iteration,
-                overall=critique.overall if filtered_issues else "PASS",
-                issues=filtered_issues,
-                approved_sections=critique.approved_sections,
-                summary=critique.summary,
+    # Thread entries for the whole step go out in one write+fsync, sharing a ts
+    batch_ts = utc_now_iso()
+    with JsonlBatcher(context.thread_path) as critique_log:
+        for (rc, stdout, stderr), (agent_name, constraint) in zip(results, task_info):
+            critique = parse_critique(stdout, agent_name, constraint.id, context.iteration)
+            critiques.append(critique)
+
+            # Save critique
+            save_json_atomic(critiques_dir / f"{constraint.id}-{agent_name}.json", critique.to_dict())
+
+            # Apply behaviors post-hoc
+            filtered_issues = []
+            for issue in critique.issues:
+                behavior = get_behavior_for_severity(constraint, issue.severity, context.genflow_cfg)
+
+                if behavior == IssueBehavior.HALT:
+                    if not halted:
+                        halted = True
+                        halt_reason = f"{issue.severity} issue in {constraint.id}"
+                    filtered_issues.append(issue)
+                elif behavior == IssueBehavior.ESCALATE:
+                    escalate_issues.append(issue)
+                elif behavior == IssueBehavior.CONTINUE:
+                    filtered_issues.append(issue)
+                # IGNORE: don't add to filtered
+
+            # Create filtered critique
+            if filtered_issues or not critique.issues:
+                filtered_critique = Critique(
+                    constraint_id=critique.constraint_id,
+                    reviewer=critique.reviewer,
+                    iteration=critique.iteration,
+                    overall=critique.overall if filtered_issues else "PASS",
+                    issues=filtered_issues,
+                    approved_sections=critique.approved_sections,
+                    summary=critique.summary,
+                )
+                filtered_critiques.append(filtered_critique)
+
+            # Log summary
+            issue_count = len(critique.issues)
+            if issue_count > 0:
+                critical = sum(1 for i in critique.issues if i.severity == "CRITICAL")
+                high = sum(1 for i in critique.issues if i.severity == "HIGH")
+                write_live(f"  {agent_name} ({constraint.id}): {critical} CRITICAL, {high} HIGH, {issue_count - critical - high} other")
+            else:
+                write_live(f"  {agent_name} ({constraint.id}): PASS")
+
+            # Log to thread
+            critique_log.append(
+                {
+                    **thread_event_header(f"critique:{agent_name}:{constraint.id}", batch_ts),
+                    "iteration": context.iteration,
+                    "phase": "critique",
+                    "step_name": step_name,
+                    "agent": agent_name,
+                    "constraint": constraint.id,
+                    "issues_count": issue_count,
+                    "overall": critique.overall,
+                },
             )
-            filtered_critiques.append(filtered_critique)
-
-        # Log summary
-        issue_count = len(critique.issues)
-        if issue_count > 0:
-            critical = sum(1 for i in critique.issues if i.severity == "CRITICAL")
-            high = sum(1 for i in critique.issues if i.severity == "HIGH")
-            write_live(f"  {agent_name} ({constraint.id}): {critical} CRITICAL, {high} HIGH, {issue_count - critical - high} other")
-        else:
-            write_live(f"  {agent_name} ({constraint.id}): PASS")
-
-        # Log to thread
-        append_jsonl_durable(
-            context.thread_path,
-            {
-                "id": sha256(f"critique:{agent_name}:{constraint.id}:{utc_now_iso()}"),
-                "ts": utc_now_iso(),
-                "iteration": context.iteration,
-                "phase": "critique",
-                "step_name": step_name,
-                "agent": agent_name,
-                "constraint": constraint.id,
-                "issues_count": issue_count,
-                "overall": critique.overall,
-            },
-        )
 
     return CritiqueStepResult(
         critiques=critiques,
@@ -854,12 +853,16 @@ async def execute_adjudicate_step(step: WorkflowStep, context: WorkflowContext)
         max_iterations=context.max_iterations,
     )
 
-    write_text_atomic(iter_dir / f"prompt_adjudicate_{agent_name}.txt", prompt)
+    # Encoded once for both the prompt file and the adjudicator's stdin
+    prompt_bytes = prompt.encode("utf-8")
+    del prompt
+
+    write_bytes_fast(iter_dir / f"prompt_adjudicate_{agent_name}.txt", prompt_bytes)
 
     # Run adjudicator
     stream_prefix = agent_name if not context.no_stream else None
     rc, stdout, stderr = await run_process(
-        agent_cmd, prompt, agent.timeout, stream_prefix, agent.suppress_stderr
+        agent_cmd, prompt_bytes, agent.timeout, stream_prefix, agent.suppress_stderr
     )
 
     if rc != 0 and not stdout.strip():
@@ -896,8 +899,7 @@ async def execute_adjudicate_step(step: WorkflowStep, context: WorkflowContext)
     append_jsonl_durable(
         context.thread_path,
         {
-            "id": sha256(f"adjudicate:{utc_now_iso()}:{context.iteration}"),
-            "ts": utc_now_iso(),
+            **thread_event_header(f"adjudicate:{context.iteration}"),
             "iteration": context.iteration,
             "phase": "adjudicate",
             "step_name": step_name,
@@ -976,7 +978,7 @@ async def execute_refine_step(step: WorkflowStep, context: WorkflowContext) -> i
         write_live(f"  {agent_name} → applying surgical edits...")
 
         # Copy current artifact to working file
-        shutil.copy(context.artifact_path, curr_artifact_path)
+        copy_file_contents(context.artifact_path, curr_artifact_path)
 
         prompt = build_refinement_prompt(
             artifact_path=curr_artifact_path,
@@ -1005,7 +1007,7 @@ async def execute_refine_step(step: WorkflowStep, context: WorkflowContext) -> i
             iteration=context.iteration,
         )
 
-    write_text_atomic(iter_dir / f"prompt_refine_{agent_name}.txt", prompt)
+    write_text_fast(iter_dir / f"prompt_refine_{agent_name}.txt", prompt)
 
     # Run refine
     stream_prefix = agent_name if not context.no_stream else None
@@ -1026,14 +1028,13 @@ async def execute_refine_step(step: WorkflowStep, context: WorkflowContext) -> i
 
     context.artifact_path = curr_artifact_path
 
-    write_live(f"  ✓ Refined artifact (~{len(context.artifact.split())} words)")
+    write_live(f"  ✓ Refined artifact (~{count_words(context.artifact.encode('utf-8'))} words)")
 
     # Log to thread
     append_jsonl_durable(
         context.thread_path,
         {
-            "id": sha256(f"refine:{utc_now_iso()}:{context.iteration}"),
-            "ts": utc_now_iso(),
+            **thread_event_header(f"refine:{context.iteration}"),
             "iteration": context.iteration,
             "phase": "refine",
             "step_name": step_name,
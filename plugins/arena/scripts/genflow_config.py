@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Literal, Optional
 import yaml
 
 from models import Constraint
+from utils import load_yaml
 from genloop_config import (
     ConstraintConfig,
     AdjudicationConfig,
@@ -207,7 +208,8 @@ def load_genflow_config(config_path: Path) -> GenflowConfig:
         raise FileNotFoundError(f"Genflow config not found: {config_path}")
 
     try:
-        raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        with config_path.open("rb") as f:
+            raw = load_yaml(f)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Invalid YAML in genflow config: {e}")
 
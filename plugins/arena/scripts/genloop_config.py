@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
 from models import Constraint
+from utils import list_yaml_files, load_yaml
 
 logger = logging.getLogger("arena")
 
@@ -98,10 +99,14 @@ class GeneratePhaseConfig:
 class CritiquePhaseConfig:
     """Critique phase configuration."""
     pattern: str = "parallel"
+    max_concurrent: int = 0  # Critic processes running at once (0 = no limit)
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "CritiquePhaseConfig":
-        return cls(pattern=d.get("pattern", "parallel"))
+        return cls(
+            pattern=d.get("pattern", "parallel"),
+            max_concurrent=d.get("max_concurrent", 0),
+        )
 
 
 @dataclasses.dataclass
@@ -292,7 +297,8 @@ def load_genloop_config(config_path: Path) -> GenloopConfig:
         raise FileNotFoundError(f"Genloop config not found: {config_path}")
 
     try:
-        raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        with config_path.open("rb") as f:
+            raw = load_yaml(f)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Invalid YAML in genloop config: {e}")
 
@@ -416,7 +422,7 @@ def resolve_constraint_paths(
         if not dir_path.is_absolute():
             dir_path = project_root / dir_path
         if dir_path.exists() and dir_path.is_dir():
-            for yaml_file in sorted(dir_path.glob("*.yaml")):
+            for yaml_file in list_yaml_files(dir_path):
                 if yaml_file not in paths:
                     paths.append(yaml_file)
         else:
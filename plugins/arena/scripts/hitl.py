@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from utils import (
-    utc_now_iso, sha256, load_json, save_json_atomic, write_live,
+    utc_now_iso, fast_id, load_json, save_json_atomic, write_live,
 )
 
 
@@ -25,7 +25,7 @@ def ingest_hitl_answers(state_dir: Path) -> Optional[Dict[str, Any]]:
         return None
 
     # Move to processed (don't delete, keep for audit)
-    processed_path = state_dir / "hitl" / f"answers_{sha256(utc_now_iso())}.processed.json"
+    processed_path = state_dir / "hitl" / f"answers_{fast_id(utc_now_iso())}.processed.json"
     answers_path.rename(processed_path)
 
     return answers
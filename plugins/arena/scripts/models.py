@@ -9,14 +9,13 @@ from __future__ import annotations
 
 import dataclasses
 import fcntl
+import functools
 import logging
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, IO
 
-import yaml
-
-from utils import utc_now_iso
+from utils import utc_now_iso, load_yaml
 from sources import SourceBlock
 
 logger = logging.getLogger("arena")
@@ -24,6 +23,9 @@ logger = logging.getLogger("arena")
 # Default timeout for agent processes
 DEFAULT_TIMEOUT_SECONDS: Optional[int] = None  # No timeout by default
 
+# Characters of a constraint summary shown in the adjudicator's constraint list
+SUMMARY_PREVIEW_LENGTH = 100
+
 
 class OrchestratorLock:
     """File-based lock to prevent concurrent orchestrator runs."""
@@ -115,6 +117,22 @@ class Envelope:
 # Reliable Generation: Constraint System
 # =============================================================================
 
+@dataclasses.dataclass(slots=True)
+class ThreadEntry:
+    """The fields of a thread.jsonl entry that prompts and stagnation checks read."""
+    agent: str
+    status: str
+    content: str
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "ThreadEntry":
+        return cls(
+            agent=d.get("agent", "?"),
+            status=d.get("status", "?"),
+            content=d.get("content", ""),
+        )
+
+
 @dataclasses.dataclass
 class ConstraintRule:
     """A single rule within a constraint."""
@@ -138,10 +156,16 @@ class Constraint:
     agents: Optional[List[str]] = None  # Per-constraint agent override (e.g., ["claude", "codex"])
     behavior: Optional[Dict[str, str]] = None  # Per-severity behavior overrides for genflow
 
+    @functools.cached_property
+    def summary_preview(self) -> str:
+        """Truncated summary, computed once per constraint."""
+        return self.summary[:SUMMARY_PREVIEW_LENGTH]
+
     @classmethod
     def from_yaml(cls, path: Path) -> "Constraint":
         """Load constraint from YAML file."""
-        content = yaml.safe_load(path.read_text(encoding="utf-8"))
+        with path.open("rb") as f:
+            content = load_yaml(f)
 
         # Validate: cannot have both 'source' and 'sources'
         has_source = "source" in content and content["source"]
@@ -202,7 +226,7 @@ class Constraint:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CritiqueIssue:
     """A single issue found by a critic."""
     id: str
@@ -215,7 +239,7 @@ class CritiqueIssue:
     confidence: float = 0.9
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Critique:
     """Structured critique output from a critic agent."""
     constraint_id: str
@@ -274,7 +298,7 @@ class Critique:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AdjudicationDecision:
     """A single decision in an adjudication."""
     issue_id: str
@@ -288,7 +312,7 @@ class AdjudicationDecision:
     guidance: Optional[str] = None
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Adjudication:
     """Structured adjudication output."""
     iteration: int
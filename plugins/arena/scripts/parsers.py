@@ -6,14 +6,14 @@ Functions for parsing agent outputs: envelopes, critiques, adjudications.
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
 from pathlib import Path
 from typing import List, Tuple
 
-import yaml
-
+from utils import json_loads, load_yaml
 from models import (
     Envelope,
     Critique, CritiqueIssue,
@@ -22,18 +22,29 @@ from models import (
 
 logger = logging.getLogger("arena")
 
+# Compiled once at import; these run on every agent response
+JSON_OBJECT_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+ADJUDICATION_SECTION_PATTERN = re.compile(
+    r"===\s*ADJUDICATION\s*===\s*([\s\S]*?)(?====\s*BILL_OF_WORK\s*===|$)"
+)
+BILL_OF_WORK_SECTION_PATTERN = re.compile(r"===\s*BILL_OF_WORK\s*===\s*([\s\S]*?)$")
+CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)```", re.DOTALL)
+JSON_BLOCK_PATTERN = re.compile(r"```json\s*([\s\S]*?)```", re.DOTALL)
+YAML_BLOCK_PATTERN = re.compile(r"```yaml\s*([\s\S]*?)```", re.DOTALL)
+BARE_BLOCK_PATTERN = re.compile(r"```\s*([\s\S]*?)```", re.DOTALL)
+
 
 def parse_critique(raw: str, agent_name: str, constraint_id: str, iteration: int) -> Critique:
     """Parse critique JSON from agent output."""
     raw = raw.strip()
 
     # Try to extract JSON from markdown code blocks
-    json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", raw, re.DOTALL)
+    json_match = JSON_OBJECT_BLOCK_PATTERN.search(raw)
     if json_match:
         raw = json_match.group(1)
 
     try:
-        obj = json.loads(raw)
+        obj = json_loads(raw)
         critique = Critique.from_dict(obj)
         critique.reviewer = agent_name
         critique.constraint_id = constraint_id
@@ -63,29 +74,23 @@ def parse_adjudication(raw: str, iteration: int) -> Adjudication:
     raw = raw.strip()
 
     # Try multi-section format first (avoids nested code block issues)
-    adj_section_match = re.search(
-        r"===\s*ADJUDICATION\s*===\s*([\s\S]*?)(?====\s*BILL_OF_WORK\s*===|$)",
-        raw
-    )
-    bow_section_match = re.search(
-        r"===\s*BILL_OF_WORK\s*===\s*([\s\S]*?)$",
-        raw
-    )
+    adj_section_match = ADJUDICATION_SECTION_PATTERN.search(raw)
+    bow_section_match = BILL_OF_WORK_SECTION_PATTERN.search(raw)
 
     if adj_section_match:
         adj_raw = adj_section_match.group(1).strip()
         bill_of_work = bow_section_match.group(1).strip() if bow_section_match else ""
 
         # Extract JSON from the adjudication section (may be in code block)
-        json_block = re.search(r"```(?:json)?\s*([\s\S]*?)```", adj_raw, re.DOTALL)
+        json_block = CODE_BLOCK_PATTERN.search(adj_raw)
         if json_block:
             adj_raw = json_block.group(1).strip()
 
         try:
-            obj = json.loads(adj_raw)
+            obj = json_loads(adj_raw)
         except json.JSONDecodeError:
             try:
-                obj = yaml.safe_load(adj_raw)
+                obj = load_yaml(adj_raw)
             except Exception as e:
                 logger.warning(f"Failed to parse adjudication section: {e}")
                 return Adjudication(
@@ -104,23 +109,23 @@ def parse_adjudication(raw: str, iteration: int) -> Adjudication:
 
     # Legacy format: single JSON/YAML block with embedded bill_of_work
     # Extract content from markdown code blocks
-    json_block = re.search(r"```json\s*([\s\S]*?)```", raw, re.DOTALL)
+    json_block = JSON_BLOCK_PATTERN.search(raw)
     if json_block:
         raw = json_block.group(1).strip()
     else:
-        yaml_block = re.search(r"```yaml\s*([\s\S]*?)```", raw, re.DOTALL)
+        yaml_block = YAML_BLOCK_PATTERN.search(raw)
         if yaml_block:
             raw = yaml_block.group(1).strip()
         else:
-            bare_block = re.search(r"```\s*([\s\S]*?)```", raw, re.DOTALL)
+            bare_block = BARE_BLOCK_PATTERN.search(raw)
             if bare_block:
                 raw = bare_block.group(1).strip()
 
     try:
-        obj = json.loads(raw)
+        obj = json_loads(raw)
     except json.JSONDecodeError:
         try:
-            obj = yaml.safe_load(raw)
+            obj = load_yaml(raw)
             if not isinstance(obj, dict):
                 raise ValueError(f"YAML parsed to {type(obj).__name__}, expected dict")
         except Exception as e:
@@ -145,12 +150,12 @@ def parse_envelope(raw: str, agent_kind: str) -> Tuple[Envelope, str]:
     # Handle Gemini's wrapper format: {"response": "...", ...}
     if agent_kind == "gemini":
         try:
-            outer = json.loads(raw)
+            outer = json_loads(raw)
             if isinstance(outer, dict) and "response" in outer:
                 inner_raw = outer["response"]
                 if isinstance(inner_raw, str):
                     try:
-                        inner = json.loads(inner_raw)
+                        inner = json_loads(inner_raw)
                         if isinstance(inner, dict):
                             return Envelope.from_dict(inner), ""
                     except json.JSONDecodeError:
@@ -164,12 +169,12 @@ def parse_envelope(raw: str, agent_kind: str) -> Tuple[Envelope, str]:
 
     # Standard JSON envelope parsing (Claude, Codex)
     # Try to extract JSON from potential markdown code blocks
-    json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", raw, re.DOTALL)
+    json_match = JSON_OBJECT_BLOCK_PATTERN.search(raw)
     if json_match:
         raw = json_match.group(1)
 
     try:
-        obj = json.loads(raw)
+        obj = json_loads(raw)
         if isinstance(obj, dict):
             return Envelope.from_dict(obj), ""
         return Envelope.error("Output is not a JSON object"), "not_object"
@@ -179,10 +184,18 @@ def parse_envelope(raw: str, agent_kind: str) -> Tuple[Envelope, str]:
         return Envelope.error(f"JSON parse error: {e}. Raw: {truncated}"), str(e)
 
 
+@functools.lru_cache(maxsize=8)
+def _resolved_root(base_dir: Path) -> str:
+    """base_dir resolved, as a string prefix (cached: it's the project root every turn)."""
+    return str(base_dir.resolve())
+
+
 def validate_artifacts(env: Envelope, base_dir: Path) -> List[str]:
     """Validate artifact paths exist and are within base_dir. Returns list of warnings."""
-    warnings = []
-    base_resolved = base_dir.resolve()
+    warnings: List[str] = []
+    if not env.artifacts:
+        return warnings
+    base_prefix = _resolved_root(base_dir)
 
     for art in env.artifacts:
         art_path = Path(art.get("path", ""))
@@ -192,7 +205,7 @@ def validate_artifacts(env: Envelope, base_dir: Path) -> List[str]:
         try:
             resolved = art_path.resolve()
             # Security: check path traversal
-            if not str(resolved).startswith(str(base_resolved)):
+            if not str(resolved).startswith(base_prefix):
                 warnings.append(f"Artifact path escapes base directory: {art.get('path')}")
                 logger.warning(f"Path traversal attempt blocked: {art.get('path')}")
                 continue
@@ -32,6 +32,7 @@ for _venv_base in [_script_dir, _script_dir.parent]:
 
 import json
 import logging
+import os
 import subprocess
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -39,6 +40,12 @@ from typing import Optional
 
 import yaml
 
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger("arena.router")
 
 # Default experts if routing fails
@@ -89,7 +96,12 @@ def load_experts(experts_dir: Path) -> list[Expert]:
         logger.error(f"Experts directory not found: {experts_dir}")
         return experts
 
-    yaml_files = list(experts_dir.glob("*.yaml"))
+    # One directory scan; its file types spare a stat per expert file
+    with os.scandir(experts_dir) as entries:
+        yaml_files = sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".yaml") and not entry.name.startswith(".") and entry.is_file()
+        )
     if not yaml_files:
         logger.error(f"No .yaml files found in experts directory: {experts_dir}")
         return experts
@@ -97,7 +109,7 @@ def load_experts(experts_dir: Path) -> list[Expert]:
     for yaml_file in yaml_files:
         try:
             with open(yaml_file) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
                 if data:
                     experts.append(Expert.from_dict(data))
                 else:
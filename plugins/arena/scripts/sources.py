@@ -10,6 +10,7 @@ from __future__ import annotations
 import dataclasses
 import glob as glob_module
 import logging
+import os
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -337,6 +338,60 @@ def resolve_source_block(
     )
 
 
+# Results of resolve_source_block_cached: key -> (result, signatures of files read)
+_resolved_cache: Dict[Tuple[Any, ...], Tuple[ResolvedSources, List[Tuple[str, int, int]]]] = {}
+
+
+def _file_signatures(paths: List[str]) -> Optional[List[Tuple[str, int, int]]]:
+    """(path, mtime_ns, size) for each path, or None if any can't be stat'ed."""
+    signatures = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        signatures.append((path, st.st_mtime_ns, st.st_size))
+    return signatures
+
+
+def resolve_source_block_cached(
+    source_block: SourceBlock,
+    ctx: Dict[str, Path],
+    base_dir: Path,
+    allow_scripts: bool = False,
+) -> ResolvedSources:
+    """Like resolve_source_block, but reuse the last result while its inputs are unchanged.
+
+    A cached result is reused only while every file it read keeps the same
+    mtime and size. Blocks whose output can't be checked that cheaply are
+    always resolved afresh: ones that run scripts, and ones that reference
+    {{artifact}} (a new file each iteration). Glob patterns are not re-expanded,
+    so a file created mid-run that would newly match is only seen by a fresh
+    resolve.
+    """
+    templates = [*source_block.files, *source_block.globs, *source_block.scripts]
+    if (allow_scripts and source_block.scripts) or any("{{artifact}}" in t for t in templates):
+        return resolve_source_block(source_block, ctx, base_dir, allow_scripts)
+
+    key = (
+        repr(source_block),
+        tuple(sorted((var, str(value)) for var, value in ctx.items() if var != "artifact")),
+        str(base_dir),
+        allow_scripts,
+    )
+    cached = _resolved_cache.get(key)
+    if cached is not None:
+        resolved, signatures = cached
+        if _file_signatures(resolved.files_read) == signatures:
+            return resolved
+
+    resolved = resolve_source_block(source_block, ctx, base_dir, allow_scripts)
+    signatures = _file_signatures(resolved.files_read)
+    if signatures is not None:
+        _resolved_cache[key] = (resolved, signatures)
+    return resolved
+
+
 def resolve_legacy_sources(
     sources: List[str],
     ctx: Dict[str, Path],
@@ -8,22 +8,80 @@ Extracted from arena.py to enable modular imports.
 from __future__ import annotations
 
 import datetime as dt
+import errno
+import functools
 import hashlib
 import json
 import os
 import re
+import shutil
 import stat
 import tempfile
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Dict, IO, Optional
+from typing import Any, Dict, IO, List, Optional, Union
 
 import logging
 
+import yaml
+
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# orjson is optional: a faster drop-in for json.loads when installed. Its
+# JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def json_dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one JSONL line (UTF-8, trailing newline), via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # e.g. ints beyond 64 bits, which the stdlib handles
+            pass
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj as 2-space indented JSON (UTF-8), via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 logger = logging.getLogger("arena")
 
-# Valid characters for mode/persona names (security: prevent path traversal)
-VALID_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+# Valid characters for mode/persona names (security: prevent path traversal).
+# \Z rather than $ so a trailing newline can't slip through.
+VALID_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+\Z")
+
+# Maps ASCII whitespace (as bytes.split() defines it) to b" " and every other
+# byte to b"x", so words can be counted as " x" boundaries with bytes.count
+_WORD_BOUNDARY_TABLE = bytes(
+    0x20 if b in b" \t\n\r\x0b\x0c" else 0x78 for b in range(256)
+)
+
+# Buffered thread-log bytes that force a JsonlBatcher flush
+JSONL_BATCH_MAX_BYTES = 64 * 1024
+
+# Buffers passed to one writev(2) call (IOV_MAX on Linux and macOS)
+WRITEV_MAX_CHUNKS = 1024
+
+# Journaled state updates that force a StateJournal checkpoint
+STATE_JOURNAL_MAX_UPDATES = 8
 
 # Global live log file handle (set by orchestrator)
 _live_log: Optional[IO[str]] = None
@@ -49,14 +107,77 @@ def write_live(msg: str, prefix: str = "") -> None:
         _live_log.flush()
 
 
+def write_live_lines(lines: List[str]) -> None:
+    """Write several lines to the live log with one timestamp and one flush."""
+    if _live_log and lines:
+        ts = dt.datetime.now().strftime("%H:%M:%S")
+        _live_log.write("".join(f"[{ts}] {line}\n" for line in lines))
+        _live_log.flush()
+
+
 def utc_now_iso() -> str:
     """Return current UTC time in ISO format."""
     return dt.datetime.now(dt.timezone.utc).isoformat()
 
 
+def thread_event_header(label: str, ts: Optional[str] = None) -> Dict[str, str]:
+    """The "id" and "ts" fields of a new thread entry, from a single timestamp.
+
+    The id hashes the label together with that timestamp; it only needs to
+    be unique, so it uses fast_id(). Entries written as one batch can share
+    a ts (labels within a batch are distinct); it defaults to now.
+    """
+    if ts is None:
+        ts = utc_now_iso()
+    return {"id": fast_id(f"{label}:{ts}"), "ts": ts}
+
+
 def read_text(path: Path) -> str:
     """Read text from file, return empty string if file doesn't exist."""
-    return path.read_text(encoding="utf-8") if path.exists() else ""
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+
+
+def read_last_lines(path: Path, n: int, block_size: int = 8192) -> List[bytes]:
+    """Return the last n lines of a file (without newlines), reading backwards.
+
+    Only the tail of the file is read, so the cost doesn't grow with file size.
+    Returns [] if the file doesn't exist.
+    """
+    if n <= 0:
+        return []
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks: List[bytes] = []
+        newlines = 0
+        # n + 1 newlines guarantee the last n lines are complete (one may be
+        # the file's trailing newline)
+        while pos > 0 and newlines <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    lines = b"".join(reversed(blocks)).split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+    return lines[-n:]
+
+
+def count_words(data: bytes) -> int:
+    """Count whitespace-separated words, same as len(data.split()).
+
+    Uses one translate and one count instead of building a list of words.
+    """
+    marked = data.translate(_WORD_BOUNDARY_TABLE)
+    return marked.count(b" x") + marked.startswith(b"x")
 
 
 def ensure_secure_dir(path: Path) -> None:
@@ -65,13 +186,40 @@ def ensure_secure_dir(path: Path) -> None:
     path.chmod(stat.S_IRWXU)  # 0700: rwx for owner only
 
 
+def replace_symlink(link: Path, target: Union[str, Path]) -> None:
+    """Point link at target atomically (symlink to a temp name, then rename over).
+
+    Readers see either the old or the new link, never a missing one.
+    """
+    tmp = link.with_name(f".{link.name}.{os.getpid()}.tmp")
+    try:
+        tmp.unlink()
+    except FileNotFoundError:
+        pass
+    os.symlink(target, tmp)
+    try:
+        os.replace(tmp, link)
+    except OSError:
+        tmp.unlink()
+        raise
+
+
 def write_text_atomic(path: Path, text: str) -> None:
     """Atomic write: write to temp file, fsync, then rename."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    write_bytes_atomic(path, text.encode("utf-8"))
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Atomic write of already-encoded bytes: temp file, fsync, then rename."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    except FileNotFoundError:
+        # Parents are created on demand; usually they exist already
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(text)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())
         os.rename(tmp_path, path)
@@ -81,22 +229,238 @@ def write_text_atomic(path: Path, text: str) -> None:
         raise
 
 
+def copy_file_contents(src: Path, dst: Path) -> None:
+    """Copy a file's bytes to dst (no mode or metadata, unlike shutil.copy).
+
+    Uses copy_file_range(2) where available: the copy stays in the kernel and
+    can be a reflink on copy-on-write filesystems. Falls back to
+    shutil.copyfile when the call isn't supported for these files.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    shutil.copyfile(src, dst)
+
+
+def write_text_fast(path: Path, text: str) -> None:
+    """Plain write (no temp file, fsync or rename) for debugging copies.
+
+    For files nothing reads back, like saved prompts, where a torn write after
+    a crash doesn't matter. Permissions match write_bytes_atomic's (0600).
+    """
+    write_bytes_fast(path, text.encode("utf-8"))
+
+
+def write_bytes_fast(path: Path, data: bytes) -> None:
+    """Bytes version of write_text_fast."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(path, flags, 0o600)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, flags, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+def write_chunks(fd: int, chunks: List[bytes]) -> None:
+    """Write chunks to fd back to back, with writev(2) where available.
+
+    Retries after short writes. Falls back to one joined write on platforms
+    without os.writev.
+    """
+    if not hasattr(os, "writev"):
+        chunks = [b"".join(chunks)]
+    views = [memoryview(c) for c in chunks if c]
+    start = 0
+    while start < len(views):
+        batch = views[start:start + WRITEV_MAX_CHUNKS]
+        written = os.writev(fd, batch) if len(batch) > 1 else os.write(fd, batch[0])
+        for view in batch:
+            if written < len(view):
+                views[start] = view[written:]
+                break
+            written -= len(view)
+            start += 1
+
+
 def append_jsonl_durable(path: Path, obj: Dict[str, Any]) -> None:
     """Append to JSONL with fsync for durability (not atomic, but durable)."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(obj, ensure_ascii=False) + "\n"
-    with path.open("a", encoding="utf-8") as f:
+    line = json_dumps_line(obj)
+    try:
+        f = path.open("ab")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = path.open("ab")
+    with f:
         f.write(line)
         f.flush()
         os.fsync(f.fileno())
 
 
+class JsonlBatcher:
+    """Buffered JSONL appender for a single file.
+
+    Records are held in memory and written with one write+fsync per flush(),
+    instead of one per record as with append_jsonl_durable. Callers flush at
+    their checkpoints (before reading the file back, before exiting); a flush
+    also happens on its own once max_bytes are buffered.
+
+    Each record's serialized line is kept as-is and the lines are handed to
+    writev(2) together, so large messages aren't copied into a joined buffer.
+    The file is opened (O_APPEND) on the first flush and kept open until
+    close(), so flushes don't pay for an open/close each.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = JSONL_BATCH_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lines: List[bytes] = []
+        self._size = 0
+        self._fd: Optional[int] = None
+
+    def append(self, obj: Dict[str, Any]) -> None:
+        """Buffer one record, flushing if the buffer is full."""
+        line = json_dumps_line(obj)
+        self._lines.append(line)
+        self._size += len(line)
+        if self._size >= self.max_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write and fsync all buffered records (no-op when nothing is buffered)."""
+        if not self._lines:
+            return
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        write_chunks(self._fd, self._lines)
+        os.fsync(self._fd)
+        self._lines.clear()
+        self._size = 0
+
+    def close(self) -> None:
+        """Flush anything buffered and close the file."""
+        try:
+            self.flush()
+        finally:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def __enter__(self) -> "JsonlBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class StateJournal:
+    """A JSON state snapshot plus an append-only log of small updates.
+
+    update() appends just the changed top-level keys to <snapshot>.log (one
+    fsynced JSON line) instead of rewriting the whole snapshot; checkpoint()
+    writes the full snapshot and clears the log. On load the log is replayed
+    over the snapshot, so nothing is lost between checkpoints. Tools that only
+    read the snapshot see it as of the last checkpoint, so anything they rely
+    on (e.g. awaiting_human) should be checkpointed.
+
+    Log records carry a sequence number that the snapshot also stores as
+    "journal_seq"; records at or below it are already in the snapshot and are
+    skipped, which keeps a crash between the snapshot write and the log
+    cleanup harmless.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        default: Dict[str, Any],
+        max_updates: int = STATE_JOURNAL_MAX_UPDATES,
+    ) -> None:
+        self.path = path
+        self.log_path = path.with_name(path.name + ".log")
+        self.max_updates = max_updates
+        self.state: Dict[str, Any] = load_json(path, default)
+        self._seq = self.state.get("journal_seq", 0)
+        self._updates = 0
+        for line in read_text(self.log_path).splitlines():
+            try:
+                record = json_loads(line)
+            except ValueError:  # torn final line from a crash mid-append
+                continue
+            if isinstance(record, dict) and record.get("seq", 0) > self._seq:
+                self.state.update(record.get("set", {}))
+                self._seq = record["seq"]
+                self._updates += 1
+
+    def update(self, changes: Dict[str, Any]) -> None:
+        """Apply changes to the state and journal them."""
+        self.state.update(changes)
+        self._seq += 1
+        append_jsonl_durable(self.log_path, {"seq": self._seq, "set": changes})
+        self._updates += 1
+        if self._updates >= self.max_updates:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Write the full state snapshot and drop the journaled updates."""
+        self.state["journal_seq"] = self._seq
+        save_json_atomic(self.path, self.state)
+        if self._updates:
+            try:
+                self.log_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._updates = 0
+
+
+def list_yaml_files(dir_path: Path) -> List[Path]:
+    """The *.yaml files directly inside dir_path, sorted by name.
+
+    File types come from the directory scan itself, so regular files need no
+    stat call each (symlinks are still followed). Like glob("*.yaml"), hidden
+    files are skipped.
+    """
+    with os.scandir(dir_path) as entries:
+        return sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".yaml") and not entry.name.startswith(".") and entry.is_file()
+        )
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML (str, bytes, or file object) with the fastest safe loader."""
+    return yaml.load(stream, Loader=YamlLoader)
+
+
+def yaml_root_is_mapping(stream: Any) -> bool:
+    """Check whether a YAML document's root is a mapping, without building it.
+
+    Only the first few parser events are read.
+    """
+    for event in yaml.parse(stream, Loader=YamlLoader):
+        if isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+            continue
+        return isinstance(event, yaml.MappingStartEvent)
+    return False
+
+
 def load_json(path: Path, default: Any) -> Any:
     """Load JSON from file. Returns default if file missing or invalid."""
-    if not path.exists():
-        return default
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_loads(path.read_bytes())
+    except FileNotFoundError:
+        return default
     except json.JSONDecodeError as e:
         logger.warning(f"Invalid JSON in {path}: {e}")
         return default
@@ -104,7 +468,7 @@ def load_json(path: Path, default: Any) -> Any:
 
 def save_json_atomic(path: Path, obj: Any) -> None:
     """Save object as JSON with atomic write."""
-    write_text_atomic(path, json.dumps(obj, indent=2, ensure_ascii=False))
+    write_bytes_atomic(path, json_dumps_pretty(obj))
 
 
 def normalize_for_hash(s: str) -> str:
@@ -117,9 +481,38 @@ def sha256(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()[:16]
 
 
+def fast_id(s: str) -> str:
+    """Return a 16-hex-digit id for a string (BLAKE2b, not for integrity).
+
+    Same shape as sha256() above, without hashing the full 256 bits only to
+    truncate them.
+    """
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _normalized(text: str) -> str:
+    """normalize_for_hash, cached: messages are compared repeatedly."""
+    return normalize_for_hash(text)
+
+
 def text_similarity(a: str, b: str) -> float:
     """Simple text similarity using SequenceMatcher (0.0-1.0)."""
-    return SequenceMatcher(None, normalize_for_hash(a), normalize_for_hash(b)).ratio()
+    return SequenceMatcher(None, _normalized(a), _normalized(b)).ratio()
+
+
+def texts_similar(a: str, b: str, threshold: float, inclusive: bool = False) -> bool:
+    """Whether text_similarity(a, b) > threshold (>= when inclusive).
+
+    real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio(),
+    so most dissimilar pairs are rejected before the quadratic ratio() runs.
+    """
+    matcher = SequenceMatcher(None, _normalized(a), _normalized(b))
+    for score in (matcher.real_quick_ratio, matcher.quick_ratio, matcher.ratio):
+        bound = score()
+        if bound < threshold or (bound == threshold and not inclusive):
+            return False
+    return True
 
 
 def validate_name(name: str, kind: str) -> None:
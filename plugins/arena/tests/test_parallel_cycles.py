@@ -0,0 +1,56 @@
+"""Sequential runs with each cycle's agents run at once, stopped and resumed."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from arena import EXIT_HITL, EXIT_MAX_TURNS
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+
+# Agent b needs a human until its prompt carries the answers; the rest are fine
+FAKE_AGENT = """\
+import json, re, sys
+prompt = sys.stdin.read()
+name = re.search(r'You are agent "([^"]+)"', prompt).group(1)
+if name == "b" and "HUMAN ANSWERS" not in prompt.upper():
+    env = {"status": "needs_human", "message": "help", "questions": ["why?"]}
+else:
+    env = {"status": "ok", "message": f"{name} fine"}
+print(json.dumps({"artifacts": [], "questions": [], **env}))
+"""
+
+
+def run_arena(cwd: Path) -> int:
+    return subprocess.run(
+        [sys.executable, str(PLUGIN_DIR / "scripts" / "arena.py"),
+         "--config", "arena.config.json", "--name", "h", "--turns", "3", "--no-stream"],
+        cwd=cwd, capture_output=True, timeout=60,
+    ).returncode
+
+
+def test_hitl_mid_cycle_resumes_without_repeating_turns(tmp_path):
+    agent = tmp_path / "agent.py"
+    agent.write_text(FAKE_AGENT)
+    (tmp_path / "arena.config.json").write_text(json.dumps({
+        "state_dir": ".arena",
+        "global_dir": str(PLUGIN_DIR / "config"),
+        "agents": {name: {"kind": "codex", "cmd": [sys.executable, str(agent)]} for name in "abc"},
+        "order": ["a", "b", "c"],
+        "personas": {"a": "architect", "b": "code-reviewer", "c": "architect"},
+        "sequential_parallel_within_cycle": True,
+    }))
+    run_dir = tmp_path / ".arena" / "runs" / "h"
+    run_dir.mkdir(parents=True)
+    (run_dir / "goal.yaml").write_text("goal: |\n  Say hello.\n")
+
+    assert run_arena(tmp_path) == EXIT_HITL
+    (run_dir / "hitl" / "answers.json").write_text(json.dumps({"answers": [{"answer": "because"}]}))
+    assert run_arena(tmp_path) == EXIT_MAX_TURNS
+
+    with open(run_dir / "thread.jsonl") as f:
+        turns = [(e["turn"], e["agent"], e["status"]) for e in map(json.loads, f) if e["agent"] != "human"]
+    # c's result from the interrupted cycle was dropped; it ran once, after the answers
+    assert turns == [
+        (1, "a", "ok"), (2, "b", "needs_human"), (2, "b", "ok"), (3, "c", "ok"), (4, "a", "ok"),
+    ]
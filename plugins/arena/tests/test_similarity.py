@@ -0,0 +1,87 @@
+"""Similarity scores behind consensus and stagnation detection."""
+import pytest
+
+from arena import check_consensus, detect_stagnation
+from models import Envelope, ThreadEntry
+from utils import text_similarity, texts_similar
+
+BASE = (
+    "The proposed caching layer should sit between the API gateway and the "
+    "service mesh, so that repeated reads of the user profile are served "
+    "from memory. We agree that invalidation happens on every profile write, "
+    "and that the time to live stays at five minutes until we have metrics."
+)
+# Two words changed in a ~50-word message
+NEAR_DUPLICATE = BASE.replace("five minutes", "ten minutes").replace("repeated", "frequent")
+UNRELATED = "I disagree: the database should be sharded by tenant before we add any cache at all."
+# SequenceMatcher.ratio() is order-dependent: over 200 characters its autojunk
+# heuristic drops popular words from the second argument only.
+ASYMMETRIC_A = (
+    "and cache api for a in we a to api to in with on layer on is a and it "
+    "should for we be of is and for layer is it of should with for in a cache "
+    "cache the should layer layer for for is with is in layer the"
+)
+ASYMMETRIC_B = (
+    "and cache api for a in we a to api to in with on layer on is a and it "
+    "should for we be of is and for layer is it of should with in a cache "
+    "cache the should layer for for is with is in layer the"
+)
+
+
+def test_scores_are_pinned():
+    assert text_similarity(BASE, NEAR_DUPLICATE) == pytest.approx(0.9589, abs=1e-4)
+    assert text_similarity(BASE, UNRELATED) == pytest.approx(0.2253, abs=1e-4)
+    # Case and whitespace are normalized away
+    assert text_similarity(BASE, "  " + BASE.upper()) == 1.0
+    assert text_similarity(ASYMMETRIC_A, ASYMMETRIC_B) == pytest.approx(0.9747, abs=1e-4)
+    assert text_similarity(ASYMMETRIC_B, ASYMMETRIC_A) == pytest.approx(0.8182, abs=1e-4)
+
+
+@pytest.mark.parametrize("a, b", [
+    (BASE, NEAR_DUPLICATE),
+    (BASE, UNRELATED),
+    (BASE, BASE),
+    (ASYMMETRIC_A, ASYMMETRIC_B),
+    (ASYMMETRIC_B, ASYMMETRIC_A),
+    ("", ""),
+    ("short", "a much longer message than the other one"),
+])
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.85, 0.9, 1.0])
+def test_texts_similar_matches_text_similarity(a, b, threshold):
+    score = text_similarity(a, b)
+    assert texts_similar(a, b, threshold) == (score > threshold)
+    assert texts_similar(a, b, threshold, inclusive=True) == (score >= threshold)
+
+
+def test_near_duplicates_reach_consensus():
+    envelopes = {
+        "a": Envelope(status="ok", message=BASE),
+        "b": Envelope(status="ok", message=NEAR_DUPLICATE),
+    }
+    assert check_consensus(envelopes)
+    envelopes["b"] = Envelope(status="ok", message=UNRELATED)
+    assert not check_consensus(envelopes)
+
+
+@pytest.mark.parametrize("first, second", [
+    (ASYMMETRIC_A, ASYMMETRIC_B),
+    (ASYMMETRIC_B, ASYMMETRIC_A),
+], ids=["higher-first", "lower-first"])
+def test_asymmetric_pair_reaches_consensus_in_either_order(first, second):
+    # Only one direction clears the threshold; that is enough to agree.
+    envelopes = {
+        "a": Envelope(status="ok", message=first),
+        "b": Envelope(status="ok", message=second),
+    }
+    assert check_consensus(envelopes)
+
+
+def test_near_duplicate_rounds_stagnate():
+    thread = [
+        ThreadEntry.from_dict({"agent": agent, "content": content})
+        for content in (BASE, NEAR_DUPLICATE)
+        for agent in ("a", "b")
+    ]
+    assert detect_stagnation(thread, ["a", "b"])
+    thread[-1] = ThreadEntry.from_dict({"agent": "b", "content": UNRELATED})
+    assert not detect_stagnation(thread, ["a", "b"])
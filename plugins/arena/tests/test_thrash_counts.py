@@ -0,0 +1,42 @@
+"""Genloop per-issue thrash counts and their legacy state format."""
+from arena import load_thrash_counts
+from utils import StateJournal, save_json_atomic
+
+
+def test_empty_state():
+    assert load_thrash_counts({}) == ([], {})
+
+
+def test_dense_state_is_copied():
+    state = {"issue_thrash_counts": [2, 1], "issue_id_map": {"q-001": 0, "t-002": 1}}
+    counts, id_map = load_thrash_counts(state)
+    assert (counts, id_map) == ([2, 1], {"q-001": 0, "t-002": 1})
+    counts.append(0)
+    id_map["new"] = 2
+    assert state == {"issue_thrash_counts": [2, 1], "issue_id_map": {"q-001": 0, "t-002": 1}}
+
+
+def test_legacy_dict_is_converted():
+    state = {"issue_thrash_counts": {"quality-001": 2, "tone-003": 1}}
+    counts, id_map = load_thrash_counts(state)
+    assert id_map == {"quality-001": 0, "tone-003": 1}
+    assert {issue_id: counts[idx] for issue_id, idx in id_map.items()} == {
+        "quality-001": 2,
+        "tone-003": 1,
+    }
+
+
+def test_legacy_state_file_round_trips_through_journal(tmp_path):
+    # A state.json written before the dense format, resumed and updated
+    path = tmp_path / "state.json"
+    save_json_atomic(path, {"iteration": 3, "issue_thrash_counts": {"quality-001": 1}})
+    journal = StateJournal(path, {})
+    counts, id_map = load_thrash_counts(journal.state)
+    idx = id_map.setdefault("tone-003", len(id_map))
+    counts.append(0)
+    counts[idx] += 1
+    counts[id_map["quality-001"]] += 1
+    journal.update({"issue_thrash_counts": counts, "issue_id_map": id_map})
+
+    reopened = StateJournal(path, {})
+    assert load_thrash_counts(reopened.state) == ([2, 1], {"quality-001": 0, "tone-003": 1})
@@ -0,0 +1,177 @@
+"""Durability and parsing helpers in utils."""
+import json
+import os
+
+import pytest
+
+from utils import JsonlBatcher, StateJournal, count_words, load_json, read_last_lines, validate_name
+
+
+def default_state():
+    # A fresh dict each time: the journal adopts its default as the live state
+    return {"turn": 0, "awaiting_human": False}
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+# --- StateJournal ---
+
+def test_journal_replays_updates_over_snapshot(tmp_path):
+    path = tmp_path / "state.json"
+    journal = StateJournal(path, default_state())
+    journal.update({"turn": 1})
+    journal.update({"turn": 2, "done_agents": ["a"]})
+
+    # The snapshot hasn't been written yet; reopening replays the log
+    assert not path.exists()
+    reopened = StateJournal(path, default_state())
+    assert reopened.state == {"turn": 2, "awaiting_human": False, "done_agents": ["a"]}
+
+
+def test_journal_checkpoint_writes_snapshot_and_clears_log(tmp_path):
+    path = tmp_path / "state.json"
+    journal = StateJournal(path, default_state())
+    journal.update({"turn": 3})
+    journal.checkpoint()
+
+    assert not journal.log_path.exists()
+    assert load_json(path, {}) == {"turn": 3, "awaiting_human": False, "journal_seq": 1}
+
+
+def test_journal_skips_stale_log_after_checkpoint(tmp_path):
+    path = tmp_path / "state.json"
+    journal = StateJournal(path, default_state())
+    journal.update({"turn": 1})
+    stale_log = journal.log_path.read_bytes()
+    journal.update({"turn": 2})
+    journal.checkpoint()
+
+    # Crash between the snapshot write and the log cleanup: an old log survives
+    journal.log_path.write_bytes(stale_log)
+    assert StateJournal(path, default_state()).state["turn"] == 2
+
+
+def test_journal_ignores_torn_final_line(tmp_path):
+    path = tmp_path / "state.json"
+    journal = StateJournal(path, default_state())
+    journal.update({"turn": 1})
+    with journal.log_path.open("ab") as f:
+        f.write(b'{"seq": 2, "set": {"tu')
+    assert StateJournal(path, default_state()).state["turn"] == 1
+
+
+def test_journal_checkpoints_after_max_updates(tmp_path):
+    path = tmp_path / "state.json"
+    journal = StateJournal(path, default_state(), max_updates=3)
+    for turn in range(1, 4):
+        journal.update({"turn": turn})
+    assert not journal.log_path.exists()
+    assert load_json(path, {})["turn"] == 3
+
+
+# --- JsonlBatcher ---
+
+def test_batcher_holds_records_until_flush(tmp_path):
+    path = tmp_path / "thread.jsonl"
+    batcher = JsonlBatcher(path)
+    batcher.append({"n": 1})
+    assert not path.exists()
+    batcher.flush()
+    assert read_jsonl(path) == [{"n": 1}]
+    batcher.close()
+
+
+def test_batcher_flushes_at_threshold(tmp_path):
+    path = tmp_path / "thread.jsonl"
+    batcher = JsonlBatcher(path, max_bytes=50)
+    batcher.append({"content": "x" * 10})
+    assert not path.exists()
+    batcher.append({"content": "y" * 40})  # Crosses max_bytes
+    assert [r["content"][0] for r in read_jsonl(path)] == ["x", "y"]
+    batcher.close()
+
+
+def test_batcher_close_flushes_and_appends(tmp_path):
+    path = tmp_path / "thread.jsonl"
+    path.write_text('{"n": 0}\n')
+    with JsonlBatcher(path) as batcher:
+        batcher.append({"n": 1})
+        batcher.append({"n": 2})
+    assert read_jsonl(path) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+def test_batcher_survives_partial_writes(tmp_path, monkeypatch):
+    real_write, real_writev = os.write, os.writev
+
+    def short_write(fd, data):
+        return real_write(fd, bytes(data)[:7])
+
+    def short_writev(fd, buffers):
+        # Stops partway through the second buffer
+        return real_writev(fd, [buffers[0], bytes(buffers[1])[:3]])
+
+    monkeypatch.setattr(os, "write", short_write)
+    monkeypatch.setattr(os, "writev", short_writev)
+
+    path = tmp_path / "thread.jsonl"
+    records = [{"n": n, "content": "z" * (n * 5)} for n in range(20)]
+    with JsonlBatcher(path) as batcher:
+        for record in records:
+            batcher.append(record)
+    monkeypatch.undo()
+    assert read_jsonl(path) == records
+
+
+# --- read_last_lines ---
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+@pytest.mark.parametrize("n", [1, 3, 50, 1000])
+def test_read_last_lines_across_blocks(tmp_path, n, trailing_newline):
+    # Line lengths vary so lines straddle the 8 KiB block boundaries
+    lines = [(f"{i}:" + "w" * (i * 37 % 900)).encode() for i in range(200)]
+    path = tmp_path / "thread.jsonl"
+    path.write_bytes(b"\n".join(lines) + (b"\n" if trailing_newline else b""))
+    assert path.stat().st_size > 8192 * 3
+    assert read_last_lines(path, n) == lines[-n:]
+
+
+def test_read_last_lines_small_block_size(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_bytes(b"alpha\nbeta\ngamma")
+    assert read_last_lines(path, 2, block_size=3) == [b"beta", b"gamma"]
+
+
+def test_read_last_lines_edge_cases(tmp_path):
+    assert read_last_lines(tmp_path / "missing", 5) == []
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert read_last_lines(empty, 5) == []
+    assert read_last_lines(empty, 0) == []
+
+
+# --- count_words ---
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"one",
+    b"  leading and trailing  ",
+    b"tabs\tand\nnewlines\r\nand\x0bvertical\x0cfeeds",
+    b"multiple   spaces\n\n\nbetween",
+    "unicode wörds — stay whole".encode("utf-8"),
+    b" ".join([b"word"] * 1000),
+])
+def test_count_words_matches_split(data):
+    assert count_words(data) == len(data.split())
+
+
+@pytest.mark.parametrize("name", ["architect", "code-reviewer", "v2_mode", "x" * 200])
+def test_validate_name_accepts(name):
+    validate_name(name, "persona")
+
+
+@pytest.mark.parametrize("name", ["", "../etc", "a/b", "mode.md", "architect\n"])
+def test_validate_name_rejects(name):
+    with pytest.raises(ValueError):
+        validate_name(name, "persona")